@@ -0,0 +1,2881 @@
+# created by svinec (2019) - use freely but please reference my original work, thanks :)
+
+"""
+SHORT INTRO
+
+Operation scheduling is a classical problem in Operations Research. The problem arises when there are some number of operations that need to be
+assigned to different resources for execution, and we don't know what the optimal way of assinging is.
+
+Operations in this context can be anything from simple everyday tasks to complex manufacturing operations in a production facility.
+Resources in this context is any entity or unit that can do work, for example a machine can be a resource, a human worker can be a resources,
+or a whole team of people can be a resource - this is just an abstraction layer.
+Optimal solution can have different meanings depending on the objective of the problem (i.e. it can be most constraints respected, least amount
+of total time needed, etc.)
+
+The scheduling problem easily becomes very complex when we have to respect different types of constraints and different given parameters of the
+model. There are simply overwhelmingly too many possible ways of assigning a given set of operations to a given set of resources, so it is not
+easy to tell which is the best or optimal way.
+
+The complexity of this and other similar problems, means that there is no manageable mathematical formula or procedure that can be used to
+reliably calculate an optimal solution to any given problem. People have tried various methods of tackling this problem, one of which is a Genetic
+Algorithm. Generally speaking a GA is a form of a brute force search, i.e. it can search the whole space of solutions, but it won't do it one
+by one. It will use the solutions it already has and take their good traits in order to predict the next better solution. It will keep doing so
+until a good-enough solutuon is found. In doing so it mimicks the natural process of biological evolution, hence the name Genetic Algorithm.
+Some more details can be found in this video https://www.youtube.com/watch?v=e84aLKGWtW4
+"""
+
+"""
+CHANGE LOG
+
+v6.00
+- NumPy scoring backend that scores the whole population with array operations
+- operation relations are compiled into flat arrays once, when the instance is created, instead of being interpreted on every scoring
+- operation durations are normalized into a dense operation x resource matrix which is indexed directly
+- compact genome encodings, plain binary and Gray code, as an alternative to unary
+- packed genome storage, where the genomes of the whole population are held in one bit matrix
+- integer operator mode, where start times and resource ids are crossed and mutated directly without genomes
+- random numbers are drawn in bulk from one seedable generator (randomSeed), which also makes runs reproducible
+- the population is a Population container that stores members column-wise in preallocated, double-buffered rows
+- survivors are selected without sorting the whole population, with truncation, elitist, tournament or roulette selection
+- the history log stores hashed fingerprints with an optional capacity (FIFO or LRU eviction) or a Bloom filter
+- fitness cache keyed on time-normalized schedules, with hit and miss counters
+- only new members are scored, members that already have a score are not scored again
+- incremental scoring of new members that differ from a parent in only a few operations (deltaScoringThreshold)
+- Resource Succession is scored by ResourceConflicts, a sweep over the operations of every resource, which can also count every overlapping pair or the total overlap time (resourceConflictMode)
+- the population can be scored by a pool of worker processes (scoringWorkers), which get the compiled problem once and exchange members as flat arrays of integers, or read the members straight from the shared memory blocks that hold the start times, resources and scores of the population (sharedMemory, SharedPopulationBuffers, Population.share)
+- island model (Islands), several populations evolve in parallel processes and exchange their best members over a ring or fully-connected topology
+- the runs that fill the Tournament population can be done in parallel processes (tournamentWorkers), and the best members of each run are now taken after scoring
+- run() breeds until a limit is reached (generations, seconds, target score, stalled best or moving average score, or low population diversity) and tells which one, runTournament() is the Tournament mode without interaction
+- automatedTest runs in a pool of worker processes, skips the invalid combinations before it starts and can be resumed from its journal after an interruption
+- automatedTestRacing, a successive halving version of automatedTest that drops the worst parameter sets after short runs and gives more generations to the rest
+- the results of the automated tests are also stored in an SQLite database (ResultsStore), which calculates the summary and the impact analysis
+- evolve() and evolveAsync() yield a small Snapshot of every generation, so the evolution can be observed and stopped without printing or Ctrl+C
+- the scoring is pluggable (evaluator), and ask() / tell() let members be scored outside of the solver; random members added by infuseRandomToPopulation are no longer scored, they are only parents
+
+v5.00
+- Tournament mode
+
+v4.00
+- reset function
+- automated testing and dumping script
+- average score calculation now caclulates average score within populations and then across populations (it used to take the best member of each population and then average it across populations)
+
+v3.00
+- two new complex examples
+- printRandom and printAllScores
+- mutation probability and mutation size
+- average score calculation based on a sample of the latest populations
+- specify crossMinStep
+- specify crossMinStep and crossMaxStep in relative terms or absolute
+
+v2.00 added features
+- resource dependent operation duration and default duration for operation, plus scoring for fastest resources used
+- can view separate scores for each scoring method
+- improved performance - all scoring done in one iteration and not separate
+
+v1.00 added features
+- number of resources and resource succession weights
+- operation time independent on resource
+- operation relations with min and max offset and weights for each relation
+- normal / asap / alap mode
+- history keeping and retry count
+- infuse random members to the population
+- cross mode - max step
+"""
+
+import time, datetime, heapq, multiprocessing, atexit, sqlite3, asyncio, numbers
+from array import array
+from multiprocessing import shared_memory
+from collections import OrderedDict
+from random import Random
+try:
+	import numpy as np # NumPy is optional, it is only needed by the features that explicitly ask for it
+except ImportError:
+	np = None
+dtnow = datetime.datetime.now # a shortcut for logging messages
+
+
+class RandomStream():
+	""" A seedable source of random numbers for the GA. Instead of asking for one random number at a time, the numbers are drawn in bulk into a buffer and handed out from it.
+	If NumPy is available its Generator is used (and can be shared with the NumPy based features through 'generator'), otherwise Python's own random.Random.
+	Two streams created with the same seed hand out the same numbers, which makes runs reproducible."""
+	
+	def __init__( self, _seed = None, _bufferSize = 65536 ):
+		self.bufferSize = int( _bufferSize ) # How many numbers are drawn at once [1 <= integer < inf]
+		self.generator = np.random.default_rng( _seed ) if np is not None else None # NumPy Generator, or None if NumPy is not installed
+		self.fallback = Random( _seed ) if np is None else None # Python's generator, used only when NumPy is not installed
+		self.uniforms = [] # the buffer of floats in [0.0, 1.0)
+		self.uniformsIndex = 0
+		self.normals = [] # the buffer of standard normally distributed floats
+		self.normalsIndex = 0
+	
+	def draw( self, _n, _normal = False ):
+		if self.generator is not None:
+			return ( self.generator.standard_normal( _n ) if _normal else self.generator.random( _n ) ).tolist()
+		return [ self.fallback.gauss( 0, 1 ) for i in range( _n ) ] if _normal else [ self.fallback.random() for i in range( _n ) ]
+	
+	# return a list of _n floats in [0.0, 1.0)
+	def randoms( self, _n ):
+		if self.uniformsIndex + _n > len( self.uniforms ): # not enough numbers left, so draw a new buffer and keep what was left from the old one
+			self.uniforms = self.uniforms[ self.uniformsIndex : ] + self.draw( max( self.bufferSize, _n ) )
+			self.uniformsIndex = 0
+		self.uniformsIndex += _n
+		return self.uniforms[ self.uniformsIndex - _n : self.uniformsIndex ]
+	
+	# return one float in [0.0, 1.0)
+	def random( self ):
+		if self.uniformsIndex == len( self.uniforms ):
+			self.uniforms = self.draw( self.bufferSize )
+			self.uniformsIndex = 0
+		self.uniformsIndex += 1
+		return self.uniforms[ self.uniformsIndex - 1 ]
+	
+	# return a list of _n integers in [_a, _b], both ends included, like random.randint
+	def randints( self, _a, _b, _n ):
+		if _b < _a:
+			raise ValueError( "Empty range for randints: [{}, {}]".format( _a, _b ) )
+		width = _b - _a + 1
+		return [ _a + int( u * width ) for u in self.randoms( _n ) ]
+	
+	# return one integer in [_a, _b], both ends included, like random.randint
+	def randint( self, _a, _b ):
+		if _b < _a:
+			raise ValueError( "Empty range for randint: [{}, {}]".format( _a, _b ) )
+		return _a + int( self.random() * ( _b - _a + 1 ) )
+	
+	# return one normally distributed float, like random.gauss
+	def gauss( self, _mu, _sigma ):
+		if self.normalsIndex == len( self.normals ):
+			self.normals = self.draw( self.bufferSize, _normal = True )
+			self.normalsIndex = 0
+		self.normalsIndex += 1
+		return _mu + _sigma * self.normals[ self.normalsIndex - 1 ]
+	
+	
+# A compact fingerprint of a member, a 64-bit hash of its start times and resource ids. Hashes of tuples of integers are not randomized, so the same member has the same fingerprint in every process.
+def fingerprint( _start_times, _resources ):
+	return hash( ( tuple( _start_times ), tuple( _resources ) ) )
+	
+	
+class History():
+	""" The history log used by historyKeep. Instead of the members themselves, only their fingerprints are stored in a hashed container, so checking a new member takes the same time no matter how long the history is.
+	The history can be bounded to a capacity, in which case the oldest ('fifo') or the least recently seen ('lru') fingerprint is forgotten to make room for a new one.
+	In 'bloom' mode the fingerprints are stored in a Bloom filter of a fixed size, which uses far less memory but can occasionally report a new member as already seen. A bounded Bloom filter is emptied once it holds capacity fingerprints."""
+	
+	def __init__( self, _capacity = 0, _eviction = "fifo", _mode = "set", _bloomBits = 2 ** 23, _bloomHashes = 4 ):
+		self.capacity = int( _capacity ) # The maximum number of fingerprints [0 for unbounded, else 1 <= integer < inf]
+		self.eviction = str( _eviction ) # Which fingerprint to forget when the capacity is reached ['fifo' or 'lru']
+		self.mode = str( _mode ) # How the fingerprints are stored ['set' or 'bloom']
+		if self.eviction not in ( "fifo", "lru" ):
+			raise ValueError( "Invalid historyEviction: {}".format( self.eviction ) )
+		if self.mode not in ( "set", "bloom" ):
+			raise ValueError( "Invalid historyMode: {}".format( self.mode ) )
+		self.bloomBits = int( _bloomBits ) # The size of the Bloom filter in bits [1 <= integer < inf]
+		self.bloomHashes = int( _bloomHashes ) # The number of bits set for each fingerprint in the Bloom filter [1 <= integer < inf]
+		self.clear()
+	
+	def clear( self ):
+		self.fingerprints = OrderedDict() # used in 'set' mode, ordered by the time of insertion (or last use for 'lru')
+		self.bloom = bytearray( ( self.bloomBits + 7 ) // 8 ) if self.mode == "bloom" else None # used in 'bloom' mode
+		self.count = 0 # the number of fingerprints added
+		return True
+	
+	def __len__( self ):
+		return self.count
+	
+	# the positions of the bits of a fingerprint in the Bloom filter, calculated with double hashing
+	def bloomPositions( self, _fingerprint ):
+		h1 = _fingerprint & 0xFFFFFFFF
+		h2 = ( ( _fingerprint >> 32 ) & 0xFFFFFFFF ) | 1
+		return [ ( h1 + i * h2 ) % self.bloomBits for i in range( self.bloomHashes ) ]
+	
+	def __contains__( self, _fingerprint ):
+		if self.mode == "bloom":
+			return all( self.bloom[ b >> 3 ] & ( 1 << ( b & 7 ) ) for b in self.bloomPositions( _fingerprint ) )
+		return _fingerprint in self.fingerprints
+	
+	# Add a fingerprint to the history. Returns True if it was not seen before, or False if it is a duplicate.
+	def add( self, _fingerprint ):
+		if self.mode == "bloom":
+			if _fingerprint in self:
+				return False
+			if self.capacity > 0 and self.count >= self.capacity:
+				self.clear()
+			for b in self.bloomPositions( _fingerprint ):
+				self.bloom[ b >> 3 ] |= 1 << ( b & 7 )
+			self.count += 1
+			return True
+		
+		if _fingerprint in self.fingerprints:
+			if self.eviction == "lru":
+				self.fingerprints.move_to_end( _fingerprint ) # it was just seen, so it's the most recently used
+			return False
+		if self.capacity > 0 and len( self.fingerprints ) >= self.capacity:
+			self.fingerprints.popitem( last = False ) # forget the oldest or the least recently used fingerprint
+		self.fingerprints[ _fingerprint ] = None
+		self.count = len( self.fingerprints )
+		return True
+	
+	
+class FitnessCache():
+	""" A cache of scores, so that a member which has already been scored doesn't need to be scored again. The key is the fingerprint of the member and the value is its score breakdown.
+	The cache holds at most 'size' entries and forgets the least recently used ('lru') or the oldest ('fifo') entry to make room for a new one.
+	'hits' and 'misses' count how many times a score was found in the cache or not."""
+	
+	def __init__( self, _size, _eviction = "lru" ):
+		self.size = int( _size ) # The maximum number of entries [1 <= integer < inf]
+		self.eviction = str( _eviction ) # Which entry to forget when the cache is full ['lru' or 'fifo']
+		if self.eviction not in ( "fifo", "lru" ):
+			raise ValueError( "Invalid fitnessCacheEviction: {}".format( self.eviction ) )
+		self.entries = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+	
+	# return the cached value for _key, or None if it's not cached
+	def get( self, _key ):
+		value = self.entries.get( _key )
+		if value is None:
+			self.misses += 1
+			return None
+		self.hits += 1
+		if self.eviction == "lru":
+			self.entries.move_to_end( _key )
+		return value
+	
+	def put( self, _key, _value ):
+		if _key not in self.entries and len( self.entries ) >= self.size:
+			self.entries.popitem( last = False )
+		self.entries[ _key ] = _value
+		return True
+	
+	def clear( self ):
+		self.entries.clear()
+		self.hits = 0
+		self.misses = 0
+		return True
+	
+	# a summary of how much scoring work the cache saved
+	def statistics( self ):
+		lookups = self.hits + self.misses
+		return { "hits": self.hits, "misses": self.misses, "entries": len( self.entries ), "hitRate": self.hits / lookups if lookups > 0 else 0.0 }
+	
+	
+class ResourceConflicts():
+	""" Finds the operations that use the same resource at the same time. The operations are put into one bucket per resource and every bucket is swept in the order of start times.
+	Two operations conflict when the later one (by start time, then by operation id) starts before the earlier one has finished. The 'mode' controlls what is penalized:
+	'adjacent' - only neighbours in the sweep are compared, this is how Resource Succession was always scored. One long operation covering several later ones counts only once.
+	'pairs' - every conflicting pair is counted
+	'duration' - the total time of all overlaps is counted, so a small overlap costs less than a large one
+	The penalty is the count (or the time) multiplied by 'weight'."""
+	
+	modes = ( "adjacent", "pairs", "duration" )
+	
+	def __init__( self, _durationMatrix, _weight, _mode = "adjacent" ):
+		self.durationMatrix = _durationMatrix # durationMatrix[ op ][ r ] is the duration of operation 'op' on resource 'r'
+		self.weight = int( _weight )
+		self.mode = str( _mode )
+		if self.mode not in self.modes:
+			raise ValueError( "Invalid resourceConflictMode: {}".format( self.mode ) )
+	
+	# The operations of every resource sorted by start time (the sort is stable, operations with the same start time stay in the order of their ids). Only the resources listed in _resourceIds are included, if given.
+	def buckets( self, _start_times, _resources, _resourceIds = None ):
+		buckets = {}
+		for op, r in enumerate( _resources ):
+			if _resourceIds is None or r in _resourceIds:
+				buckets.setdefault( r, [] ).append( op )
+		for r in buckets:
+			buckets[ r ].sort( key = _start_times.__getitem__ )
+		return buckets
+	
+	# A list of conflicts, every conflict is a tuple of ( op1, op2, overlap ), where op1 starts first and 'overlap' is the time both operations use the resource. In 'adjacent' mode only neighbouring operations are listed.
+	def conflicts( self, _start_times, _resources, _resourceIds = None ):
+		conflicts = []
+		for r, ops in self.buckets( _start_times, _resources, _resourceIds ).items():
+			for i, op1 in enumerate( ops ):
+				end = _start_times[ op1 ] + self.durationMatrix[ op1 ][ r ]
+				for op2 in ops[ i + 1 : i + 2 ] if self.mode == "adjacent" else ops[ i + 1 : ]:
+					if _start_times[ op2 ] >= end: # the following operations start even later, so the sweep of op1 is finished
+						break
+					conflicts.append( ( op1, op2, min( end, _start_times[ op2 ] + self.durationMatrix[ op2 ][ r ] ) - _start_times[ op2 ] ) )
+		return conflicts
+	
+	# The Resource Succession score - a negative number or 0
+	def penalty( self, _start_times, _resources, _resourceIds = None ):
+		conflicts = self.conflicts( _start_times, _resources, _resourceIds )
+		if self.mode == "duration":
+			return -self.weight * sum( overlap for op1, op2, overlap in conflicts )
+		return -self.weight * len( conflicts )
+	
+	# The same as penalty, but for many members at once. The arguments are 2-D NumPy arrays where each row is a member and each column is an operation. Returns an array with the penalty of every member.
+	# Every row is sorted by resource id and then by start time, then the operations k places apart are compared for k = 1, 2, ... which is the sweep of all rows in parallel. It stops when no operation conflicts with the one k places after it, because then no operation conflicts with any later one either.
+	def penaltyPopulation( self, _start_times, _resources, _end_times ):
+		order = np.lexsort( ( _start_times, _resources ), axis = 1 )
+		sorted_resources = np.take_along_axis( _resources, order, axis = 1 )
+		sorted_start_times = np.take_along_axis( _start_times, order, axis = 1 )
+		sorted_end_times = np.take_along_axis( _end_times, order, axis = 1 )
+		penalty = np.zeros( len( _start_times ), dtype = np.int64 )
+		for k in range( 1, 2 if self.mode == "adjacent" else _start_times.shape[ 1 ] ):
+			overlaps = ( sorted_resources[ :, k: ] == sorted_resources[ :, :-k ] ) & ( sorted_start_times[ :, k: ] < sorted_end_times[ :, :-k ] )
+			if not overlaps.any():
+				break
+			if self.mode == "duration":
+				overlap = np.minimum( sorted_end_times[ :, k: ], sorted_end_times[ :, :-k ] ) - sorted_start_times[ :, k: ]
+				penalty += np.where( overlaps, overlap, 0 ).sum( axis = 1 )
+			else:
+				penalty += overlaps.sum( axis = 1 )
+		return -self.weight * penalty
+	
+	
+class Population():
+	""" A container for the members of a population. The members are stored column-wise: one list per field (start_times, resources, score, ...), where row i of every column belongs to member i.
+	The rows are preallocated and overwritten in place, so refilling the population every generation doesn't allocate new dictionaries and lists.
+	Sorting and discarding members is a reordering of the rows, the discarded rows are kept as spare storage for the next generation.
+	A single member is accessed as population[ i ], which returns an Individual - a view that reads and writes the columns, so population[ i ][ 'score' ] works just like it did with the old list of dictionaries."""
+	
+	columns = ( "start_times", "resources", "score", "score_operationRelations", "score_resourceSuccession", "score_fastestResource", "genome" ) # the names of all columns, the first two are rows of operationCount integers
+	metadata = ( "dirty", "parents" ) # the names of the columns that are used internally and are not part of a member
+	sharedColumns = ( "start_times", "resources", "score", "score_operationRelations", "score_resourceSuccession", "score_fastestResource" ) # the columns that are kept in shared memory by share()
+	
+	def __init__( self, _operationCount, _capacity = 0 ):
+		self.operationCount = int( _operationCount ) # The number of operations of every member
+		self.size = 0 # The number of members currently in the population
+		self.capacity = 0 # The number of preallocated rows
+		self.start_times = [] # [list of lists of integers]
+		self.resources = [] # [list of lists of integers]
+		self.score = [] # [list of integers]
+		self.score_operationRelations = [] # [list of integers]
+		self.score_resourceSuccession = [] # [list of integers]
+		self.score_fastestResource = [] # [list of integers]
+		self.genome = [] # [list of strings], only used when genomes are stored as strings
+		self.dirty = [] # [list of booleans], True if the member is new and has not been scored yet, so members that already have a score are not scored again
+		self.parents = [] # [list of tuples or None], the indexes of the two members of the previous population that were crossed to breed the member
+		self.genomeMatrix = None # The packed genomes when genomeStorage is 'packed' [NumPy array of uint8, one row per member]. It covers the first len( genomeMatrix ) members, the members appended after it was set are packed when they are needed.
+		self.buffers = None # [SharedPopulationBuffers or None] the shared memory that holds the sharedColumns, see share()
+		self.reserve( _capacity )
+	
+	# make sure there are at least _capacity preallocated rows
+	def reserve( self, _capacity ):
+		shared = self.buffers is not None and self.capacity < _capacity
+		if shared: # the blocks can't grow, so the columns are moved to new, larger ones
+			self.unshare()
+		while self.capacity < _capacity:
+			self.start_times.append( [ 0 ] * self.operationCount )
+			self.resources.append( [ 0 ] * self.operationCount )
+			self.score.append( 0 )
+			self.score_operationRelations.append( 0 )
+			self.score_resourceSuccession.append( 0 )
+			self.score_fastestResource.append( 0 )
+			self.genome.append( "" )
+			self.dirty.append( True )
+			self.parents.append( None )
+			self.capacity += 1
+		if shared:
+			self.share()
+		return True
+	
+	# Move the sharedColumns to shared memory blocks (see SharedPopulationBuffers), so that worker processes can read the members and write their scores without copying them.
+	# The rows of start times and resources become memoryviews of the blocks and the score columns become one memoryview each, they are used just like the lists. Rows are still overwritten in place, and reordering moves the data inside the blocks, so row i is always in slot i.
+	def share( self ):
+		if self.buffers is not None:
+			return True
+		self.reserve( 1 )
+		self.buffers = SharedPopulationBuffers( self.operationCount, self.capacity )
+		n = self.operationCount
+		for column in self.sharedColumns:
+			view = self.buffers.views[ column ]
+			values = getattr( self, column )
+			if column in ( "start_times", "resources" ):
+				rows = [ view[ i * n : i * n + n ] for i in range( self.capacity ) ]
+				for row, value in zip( rows, values ):
+					row[ : ] = array( "q", value )
+				setattr( self, column, rows )
+			else:
+				view = view[ : self.capacity ]
+				view[ : ] = array( "q", values )
+				setattr( self, column, view )
+		atexit.register( self.unshare ) # the views have to be released before the blocks are freed at exit
+		return True
+	
+	# Move the sharedColumns back to lists and free the shared memory blocks. Any memoryview of a row that is still used outside of the population becomes invalid.
+	def unshare( self ):
+		if self.buffers is None:
+			return True
+		for column in self.sharedColumns:
+			values = getattr( self, column )
+			if column in ( "start_times", "resources" ):
+				setattr( self, column, [ row.tolist() for row in values ] )
+				for row in values:
+					row.release() # every view has to be released before the blocks can be freed
+			else:
+				setattr( self, column, values.tolist() )
+				values.release()
+		self.buffers.release()
+		self.buffers = None
+		atexit.unregister( self.unshare )
+		return True
+	
+	# copy _values into row _i of _column ('start_times' or 'resources')
+	def setRow( self, _column, _i, _values ):
+		if self.buffers is None:
+			getattr( self, _column )[ _i ][ : ] = _values
+		else: # the row is a memoryview, which only takes a buffer of the same type
+			getattr( self, _column )[ _i ][ : ] = array( "q", _values )
+		return True
+	
+	def __len__( self ):
+		return self.size
+	
+	def __getitem__( self, _i ):
+		if _i < 0: _i += self.size # [-1] means the last member, just like with a list
+		if _i < 0 or _i >= self.size:
+			raise IndexError( "population index out of range" )
+		return Individual( self, _i )
+	
+	def __iter__( self ):
+		return ( Individual( self, i ) for i in range( self.size ) )
+	
+	# add a member by copying the values into the next free row, returns the index of the member
+	def append( self, _start_times, _resources, _score = 0, _genome = "", _parents = None ):
+		if self.size == self.capacity:
+			self.reserve( 2 * self.capacity + 1 )
+		i = self.size
+		self.setRow( "start_times", i, _start_times )
+		self.setRow( "resources", i, _resources )
+		self.score[ i ] = _score
+		self.score_operationRelations[ i ] = 0
+		self.score_resourceSuccession[ i ] = 0
+		self.score_fastestResource[ i ] = 0
+		self.genome[ i ] = _genome
+		self.dirty[ i ] = True
+		self.parents[ i ] = _parents
+		self.size += 1
+		return i
+	
+	# set the score breakdown ( score, score_operationRelations, score_resourceSuccession, score_fastestResource ) of member _i
+	def setScore( self, _i, _breakdown ):
+		self.score[ _i ], self.score_operationRelations[ _i ], self.score_resourceSuccession[ _i ], self.score_fastestResource[ _i ] = _breakdown
+		self.dirty[ _i ] = False
+		return True
+	
+	# the indexes of the members that need to be scored
+	def dirtyRows( self ):
+		return [ i for i in range( self.size ) if self.dirty[ i ] ]
+	
+	# force all members to be scored again, for example after changing how members are scored
+	def markDirty( self ):
+		for i in range( self.size ):
+			self.dirty[ i ] = True
+		return True
+	
+	# remove all members, but keep the rows for reuse
+	def clear( self ):
+		self.size = 0
+		self.genomeMatrix = None
+		return True
+	
+	# keep only the first _n members
+	def truncate( self, _n ):
+		self.size = min( self.size, int( _n ) )
+		if self.genomeMatrix is not None:
+			self.genomeMatrix = self.genomeMatrix[ : self.size ]
+		return True
+	
+	# The rows listed in _order become the members of the population, in that order, and every other member is discarded. This only moves references to the rows around, the rows themselves are not copied.
+	def reorder( self, _order ):
+		listed = set( _order )
+		rows = list( _order ) + [ i for i in range( self.capacity ) if i not in listed ] # the rows that are not listed are kept at the end as spare rows
+		columns = self.columns + self.metadata
+		if self.buffers is not None: # the shared columns are reordered inside the blocks
+			self.buffers.permute( rows )
+			columns = [ column for column in columns if column not in self.sharedColumns ]
+		for column in columns:
+			values = getattr( self, column )
+			values[ : ] = [ values[ i ] for i in rows ]
+		if self.genomeMatrix is not None:
+			if all( i < len( self.genomeMatrix ) for i in _order ):
+				self.genomeMatrix = self.genomeMatrix[ list( _order ) ] # the genomes move together with their members
+			else: # some of the members have no packed genome yet, they are packed again when needed
+				self.genomeMatrix = None
+		self.size = len( _order )
+		return True
+	
+	# sort the members by descending score, meaning highest score first
+	def sortByScore( self ):
+		return self.reorder( sorted( range( self.size ), key = self.score.__getitem__, reverse = True ) )
+	
+	# the scores of all members [list of integers]
+	def scores( self ):
+		return self.score[ : self.size ] if self.buffers is None else self.score[ : self.size ].tolist()
+	
+	# replace all members with copies of the given members [list of dictionaries or a Population]. Members that come with a complete score breakdown are not scored again, unless _rescore is True.
+	def load( self, _individuals, _rescore = False ):
+		self.clear()
+		for individual in _individuals:
+			i = self.append( individual[ "start_times" ], individual[ "resources" ], int( individual[ "score" ] ), individual[ "genome" ] if "genome" in individual else "" )
+			breakdown = [ individual[ "score" ] ]
+			for column in ( "score_operationRelations", "score_resourceSuccession", "score_fastestResource" ):
+				if column in individual:
+					breakdown.append( individual[ column ] )
+			if len( breakdown ) == 4 and not _rescore:
+				self.setScore( i, [ int( b ) for b in breakdown ] )
+		return True
+	
+	# A compatibility export in the shape the population used to have - a list of dictionaries {'start_times':[] , 'resources':[], 'score':int, 'genome':str, ...}, with all values copied
+	def toDicts( self ):
+		return [ self.getIndividualAsDict( i ) for i in range( self.size ) ]
+	
+	def getIndividualAsDict( self, _i ):
+		return_dict = {}
+		for column in self.columns:
+			value = getattr( self, column )[ _i ]
+			return_dict[ column ] = list( value ) if type( value ) in ( list, memoryview ) else value
+		return return_dict
+	
+	
+class Individual():
+	""" A view of one member of a Population. It doesn't hold any data itself, it reads and writes the columns of the population, so it is only valid until the population is refilled."""
+	__slots__ = ( "population", "index" )
+	
+	def __init__( self, _population, _index ):
+		self.population = _population
+		self.index = _index
+	
+	def __getitem__( self, _key ):
+		if _key not in Population.columns:
+			raise KeyError( _key )
+		return getattr( self.population, _key )[ self.index ]
+	
+	def __setitem__( self, _key, _value ):
+		if _key in ( "start_times", "resources" ):
+			self.population.setRow( _key, self.index, _value ) # copy into the existing row
+			self.population.genomeMatrix = None # the packed genome of the member no longer matches it
+			self.population.dirty[ self.index ] = True # and neither does its score
+		elif _key in Population.columns:
+			getattr( self.population, _key )[ self.index ] = _value
+		else:
+			raise KeyError( _key )
+	
+	def __contains__( self, _key ):
+		return _key in Population.columns
+	
+	def keys( self ):
+		return Population.columns
+	
+	
+class Snapshot():
+	""" The progress of a GAS instance after a generation has been scored, as given by GAS.evolve and GAS.evolveAsync. It holds just a few numbers and a reference to the best member of the generation (an Individual, nothing is copied), which is only valid until the next generation is bred."""
+	__slots__ = ( "generation", "score", "score_operationRelations", "score_resourceSuccession", "score_fastestResource", "averageScore", "elapsed", "best" )
+	
+	def __init__( self, _generation, _breakdown, _averageScore, _elapsed, _best ):
+		self.generation = _generation # the number of generations bred before this one, 0 is the initial population
+		self.score, self.score_operationRelations, self.score_resourceSuccession, self.score_fastestResource = _breakdown # the score breakdown of the best member of the generation
+		self.averageScore = _averageScore # the averageScore of the instance
+		self.elapsed = _elapsed # the seconds since the start of evolve
+		self.best = _best # [Individual]
+	
+	
+class SharedPopulationBuffers():
+	""" The storage of the start times, resources and score breakdowns of up to 'capacity' members in multiprocessing.shared_memory blocks, which the master process and its workers map directly.
+	A Population that is shared (see Population.share) keeps these columns in the blocks, so a member is written there once, when it is added, the workers read it and write its scores in place, and only the slot bounds are sent between the processes. Genomes are not shared, the workers don't need them.
+	Every block is a flat array of 64-bit integers with one row ('slot') per member: operationCount integers for start times and resources, one integer for every score column.
+	The process that creates the buffers owns them: release() frees the blocks, and it is called automatically when the interpreter exits. Other processes attach to existing blocks by giving the 'names' of the owner, and only close() their mapping."""
+	
+	blocks = ( "start_times", "resources", "score", "score_operationRelations", "score_resourceSuccession", "score_fastestResource" ) # the blocks, named after the Population columns they hold
+	scoreBlocks = blocks[ 2 : ]
+	
+	def __init__( self, _operationCount, _capacity, _names = None ):
+		self.operationCount = int( _operationCount )
+		self.capacity = int( _capacity )
+		self.owner = _names is None # True if the blocks were created by this instance, which then has to release them
+		self.memory = {} # [dictionary of SharedMemory] by block name
+		self.views = {} # [dictionary of memoryview] by block name, views of the blocks as arrays of 64-bit integers
+		for block in self.blocks:
+			if self.owner:
+				self.memory[ block ] = shared_memory.SharedMemory( create = True, size = max( self.capacity * self.rowSize( block ), 8 ) ) # a block can't be empty
+			else:
+				self.memory[ block ] = shared_memory.SharedMemory( name = _names[ block ] )
+			self.views[ block ] = self.memory[ block ].buf.cast( "q" )
+		if self.owner:
+			atexit.register( self.release )
+	
+	# the number of bytes of one slot of a block
+	def rowSize( self, _block ):
+		return 8 * self.operationCount if _block in ( "start_times", "resources" ) else 8
+	
+	# the names of the blocks, which other processes need in order to attach to them
+	def names( self ):
+		return { block: self.memory[ block ].name for block in self.memory }
+	
+	# Slot i gets the contents of slot _order[ i ] in every block, for all slots listed in _order
+	def permute( self, _order ):
+		for block in self.blocks:
+			size = self.rowSize( block )
+			memory = self.memory[ block ].buf
+			memory[ : len( _order ) * size ] = b"".join( [ memory[ i * size : ( i + 1 ) * size ] for i in _order ] ) # the slots are copied out before any of them is overwritten
+		return True
+	
+	# the start times and resources of the members in slots _lo to _hi (excluding), as flat memoryviews of operationCount integers per member
+	def readMembers( self, _lo, _hi ):
+		n = self.operationCount
+		return self.views[ "start_times" ][ _lo * n : _hi * n ], self.views[ "resources" ][ _lo * n : _hi * n ]
+	
+	# write the score breakdowns of the members in slots _lo and up, _scores is an array of 4 integers per member, as returned by scoreChunk
+	def writeScores( self, _lo, _scores ):
+		count = len( _scores ) // 4
+		for k, block in enumerate( self.scoreBlocks ):
+			self.views[ block ][ _lo : _lo + count ] = _scores[ k : : 4 ]
+		return True
+	
+	# stop using the blocks in this process
+	def close( self ):
+		for block in list( self.views ):
+			self.views.pop( block ).release() # the views have to be released before the mapping can be closed
+		for block in list( self.memory ):
+			self.memory.pop( block ).close()
+		return True
+	
+	# stop using the blocks and, if this instance owns them, free them. It is safe to call this more than once.
+	def release( self ):
+		names = self.memory
+		self.memory = {}
+		for block in list( self.views ):
+			self.views.pop( block ).release()
+		for block in names:
+			names[ block ].close()
+			if self.owner:
+				names[ block ].unlink()
+		if self.owner:
+			atexit.unregister( self.release )
+		return True
+	
+	
+# Scoring workers. Every worker process gets the compiled problem once, when it starts, and keeps it in scoringWorker. After that, only the start times and resources of the members to score are sent to it, as flat arrays of integers, and it sends back the flat array of their score breakdowns.
+# With shared memory (sharedMemory), the worker attaches to the SharedPopulationBuffers of the population being scored, and then only the slot bounds of the members are sent, see scoreSharedSlots.
+scoringWorker = None
+scoringBuffers = {} # [dictionary of SharedPopulationBuffers] the blocks the worker is attached to, by the name of their start_times block
+
+def initScoringWorker( _problem ):
+	global scoringWorker
+	scoringWorker = GAS.__new__( GAS ) # an instance with only the attributes needed for scoring, see GAS.compiledProblem
+	scoringWorker.__dict__.update( _problem )
+	atexit.register( closeScoringBuffers )
+
+def closeScoringBuffers():
+	for name in list( scoringBuffers ):
+		scoringBuffers.pop( name ).close()
+
+# score _count members, _start_times and _resources are array('q') of _count * operationCount integers, returns array('q') of _count * 4 integers ( score, score_operationRelations, score_resourceSuccession, score_fastestResource )
+def scoreChunk( _start_times, _resources, _count ):
+	worker = scoringWorker
+	n = worker.operationCount
+	if worker.scoringBackend == "numpy":
+		breakdown = worker.scoreArraysNumpy( np.frombuffer( _start_times, dtype = np.int64 ).reshape( _count, n ), np.frombuffer( _resources, dtype = np.int64 ).reshape( _count, n ) )
+		return array( "q", np.stack( breakdown, axis = 1 ).ravel().tolist() )
+	scores = array( "q" )
+	for i in range( 0, _count * n, n ):
+		scores.extend( worker.scoreIndividual( _start_times[ i : i + n ], _resources[ i : i + n ] ) )
+	return scores
+
+# score the members in slots _lo to _hi (excluding) of the shared buffers given by _buffers ( capacity, names ), the scores are written to the buffers as well
+def scoreSharedSlots( _buffers, _lo, _hi ):
+	capacity, names = _buffers
+	buffers = scoringBuffers.get( names[ "start_times" ], None )
+	if buffers is None:
+		if len( scoringBuffers ) >= 2: # the master shares two populations at most, the current one and the offspring, so the oldest blocks are no longer used
+			scoringBuffers.pop( next( iter( scoringBuffers ) ) ).close()
+		buffers = scoringBuffers[ names[ "start_times" ] ] = SharedPopulationBuffers( scoringWorker.operationCount, capacity, names )
+	start_times, resources = buffers.readMembers( _lo, _hi )
+	buffers.writeScores( _lo, scoreChunk( start_times, resources, _hi - _lo ) )
+	del start_times, resources # the views into the buffers must not outlive the call
+	return True
+	
+	
+class GAS():
+	""" This is the main class. It is self-sufficient, meaning that every instance of the class has its own set of parameters, operations, resource, etc.
+	and can function on its own. Each instance of the class can capture only one problem and solve it."""
+
+	def __init__( self, _parameters ):
+		# When an instance is created, we take the input parameters and store them inside the instance. We also do some calculations (further below).
+		self.parameters = dict( _parameters ) # A copy of the input parameters, so that worker processes can create the same instance
+		self.resourceCount = int( _parameters[ "resourceCount" ] ) # The number of resources [1 <= integer < inf]
+		self.populationSize = int( _parameters[ "populationSize" ] ) # The size of the population [1 <= integer < inf ] (a population is a collection of solutions, the number of solutions is the population size)
+		self.population = None # A container for the population [Population], it is created further below once the number of operations is known
+		self.offspring = None # A second container of the same size [Population]. The new population is bred into it and then the two are swapped, so every generation overwrites the storage of the generation before the previous one instead of allocating new storage.
+		self.survivalRate = float( _parameters[ "survivalRate" ] ) # What percent of the population survives on each breeding cycle [0.0 <= float <= 1.0]
+		self.infuseRandomToPopulation = int( _parameters[ "infuseRandomToPopulation" ] ) # How many random solutions to add to the population on each breeding cycle [0 <= integer < inf]
+		self.mutationProbability = float( _parameters[ "mutationProbability" ] ) # The probability of mutating the new genome after crossing the two genomes [0.0000 <= float <= 1.0000]. For example, a probability of 0.33 means that about one third of the new genomes generated on each breeding cycle will be mutated.
+		self.mutationSize = float( _parameters[ "mutationSize" ] ) if type( _parameters[ "mutationSize" ] ) is float else int( _parameters[ "mutationSize" ] )
+			# Mutation size controlls how many bits in the genome will have an attempted mutation. "Attempted" because there is a 50/50 chance to change from 0 to 1 or from 1 to 0.
+			# If expressed as [0.0 <= float <= 1.0] then represents the relative size of the genome and an integer will be calculated later.
+			# If expressed as [0 <= integer < inf] then it is the exact number of attempted mutations on bits from the genome.
+		self.asapAlapMode = str( _parameters[ "asapAlapMode" ] )
+			# Controlls how time constraints are scored [string]. Three modes are possible:
+			# 'normal' - An operation relation will get a negative score only if the relation is outside of the Min and Max offsets defined for that relation
+			# 'asap' - As soon as possible. Solutions that complete faster are scored higher.
+			# 'alap' - As late as possible. Solutions that complete as late as possible are scored higher.
+		self.resourceConflictMode = str( _parameters.get( "resourceConflictMode", "adjacent" ) )
+			# Controlls how violations of Resource Succession are counted [string], see ResourceConflicts:
+			# 'adjacent' - (default) an operation is checked only against the next operation on the same resource
+			# 'pairs' - every pair of operations that use the same resource at the same time is counted, so one long operation covering three others counts three times
+			# 'duration' - the total time of all overlaps is counted instead of the number of them, weightResourceSuccession is then the penalty per unit of time
+		self.weightResourceSuccession = int( _parameters[ "weightResourceSuccession" ] ) # Resource Succession means that each resource should be working on no more than one operation at any given time. Generated solutions might violate this constraint. If a constraint is violated then the solution is scored negatively with weightResourceSuccession [0 <= integer < inf]. It is a simple substraction from the total score therefore must be used wisely in conjunction with other scoring. For example, if you choose one unit of time to be one minute, and a solution violates an operation relation by 2 hours, e.g. 120, you might be okay with that if it's not critical, but if the Resource Succession is more critical for you then the weight should be something like 3000.
+		self.historyKeep = bool( _parameters[ "historyKeep" ] ) # This option will force the algorithm to keep breeding new solutions until the new population has only unique solutions (the uniqueness is across all previous solutions) [boolean]. The history only keeps fingerprints of the solutions in a hashed container, so checking a solution takes the same time regardless of the size of the history.
+		self.historyRetryCount = int( _parameters[ "historyRetryCount" ] ) # Because finding a unique solution can sometime be very slow, this option tells the algoritm how many times to try before accepting a duplicate solution and adding to the new population [0 <= integer < inf]
+		self.history = History(
+			_parameters.get( "historyCapacity", 0 ), # The maximum number of solutions to remember [0 for unbounded, else 1 <= integer < inf]
+			_parameters.get( "historyEviction", "fifo" ), # Which solution to forget when historyCapacity is reached, the oldest one ('fifo') or the least recently seen one ('lru') [string]
+			_parameters.get( "historyMode", "set" ), # 'set' remembers exact fingerprints, 'bloom' uses a Bloom filter of historyBloomBits bits which uses much less memory but can mistake a few new solutions for duplicates [string]
+			_parameters.get( "historyBloomBits", 2 ** 23 ),
+			_parameters.get( "historyBloomHashes", 4 )
+		) # A container for the history log [History]
+		self.averageScoreSampleSize = int( _parameters[ "averageScoreSampleSize" ] ) # The average score is based on the best solutions from the last N generations [0 for disabled, else 1 <= integer < inf]. This can be a useful indicator if the solver is improving the solution over time or not.
+		self.averageScoreSample = [] # A container for the best scores of the last N generations [list of integers]
+		self.averageScore = None # The average score of the current solver
+		self.generation = 0 # The number of generations bred since the last reset
+		self.best = None # A copy of the best member found since the last reset [dictionary or None]
+		self.bestGeneration = 0 # The generation in which the best member was found
+		self.tournamentPopulationSize = int( _parameters[ "tournamentPopulationSize" ] ) # When running in Tournament mode, this is the number of individuals to sample in total [1 <= integer < inf]
+		self.tournamentPopulation = [] # A list that will hold the best individuals from each run
+		self.tournamentSample = int( _parameters[ "tournamentSample" ] ) # The number of best individuals to collect from each run and save into the Tournamen population [1 <= integer < inf]
+		self.tournamentGenerations = int( _parameters[ "tournamentGenerations" ] ) # The number of generations within each run of the solver before the best individuals are saved [1 <= integer < inf]
+		self.tournamentWorkers = int( _parameters.get( "tournamentWorkers", 0 ) ) # The number of worker processes that do the runs which fill the Tournament population [0 for doing them one after another in this process, else 2 <= integer < inf]. The runs are independent, so they all run at the same time.
+		self.scoringBackend = str( _parameters.get( "scoringBackend", "python" ) )
+			# Controlls which implementation scores the population [string]. Both give exactly the same scores, so they can be compared against each other:
+			# 'python' - (default) every member is scored one by one in a Python loop
+			# 'numpy' - the whole population is held as 2-D arrays (individual x operation) and scored with a handful of array operations. Requires NumPy.
+		self.genomeEncoding = str( _parameters.get( "genomeEncoding", "unary" ) )
+			# Controlls how start times and resource ids are written into the genome [string]. Three encodings are possible:
+			# 'unary' - (default) a number is the count of 1s in a string as long as the highest possible number, e.g. 0010111011 is 6. The genome grows with operationCount * operationMaxTime.
+			# 'binary' - a number is written in plain binary using ceil( log2( operationMaxTime + 1 ) ) bits, e.g. 0110 is 6
+			# 'gray' - like 'binary', but in reflected Gray code, so neighbouring numbers differ in only one bit, e.g. 0101 is 6
+		if self.genomeEncoding not in ( "unary", "binary", "gray" ):
+			raise ValueError( "Invalid genomeEncoding: {}".format( self.genomeEncoding ) )
+		self.genomeStorage = str( _parameters.get( "genomeStorage", "string" ) )
+			# Controlls how genomes are stored while breeding [string]:
+			# 'string' - (default) every member has its own genome, a Python string of '0' and '1' characters
+			# 'packed' - the genomes of the whole population are kept in one matrix of bits packed into bytes (Population.genomeMatrix), crossing is a masked select and mutation is an XOR with a random mask. Requires NumPy.
+		if self.genomeStorage not in ( "string", "packed" ):
+			raise ValueError( "Invalid genomeStorage: {}".format( self.genomeStorage ) )
+		self.operatorMode = str( _parameters.get( "operatorMode", "genome" ) )
+			# Controlls what the genetic operators (crossing and mutation) work on [string]:
+			# 'genome' - (default) the classic way, members are converted to genomes, the genomes are crossed and mutated and then converted back to start times and resource ids
+			# 'integer' - the start times and resource ids are crossed and mutated directly, one operation at a time, and no genomes are calculated at all
+		if self.operatorMode not in ( "genome", "integer" ):
+			raise ValueError( "Invalid operatorMode: {}".format( self.operatorMode ) )
+		self.integerCrossover = str( _parameters.get( "integerCrossover", "uniform" ) )
+			# When operatorMode is 'integer', controlls how two members are crossed [string]:
+			# 'uniform' - (default) every operation (its start time and resource id) is taken from either member with a 50/50 chance
+			# 'segment' - the operations are split in steps between crossMinStep and crossMaxStep long, just like genomes are, and each step is taken from either member
+		if self.integerCrossover not in ( "uniform", "segment" ):
+			raise ValueError( "Invalid integerCrossover: {}".format( self.integerCrossover ) )
+		self.integerMutation = str( _parameters.get( "integerMutation", "gaussian" ) )
+			# When operatorMode is 'integer', controlls how a start time is mutated [string]. Either way, a mutation attempt changes the start time or reassigns the resource of a random operation with a 50/50 chance.
+			# 'gaussian' - (default) a normally distributed shift with a standard deviation of mutationStep is added to the start time
+			# 'creep' - a uniformly distributed shift between -mutationStep and +mutationStep is added to the start time
+		if self.integerMutation not in ( "gaussian", "creep" ):
+			raise ValueError( "Invalid integerMutation: {}".format( self.integerMutation ) )
+		self.selectionScheme = _parameters.get( "selectionScheme", "truncation" )
+			# Controlls how the survivors are selected on each breeding cycle [string or function]. Every scheme selects the survivors without fully sorting the population:
+			# 'truncation' - (default) the best members survive
+			# 'elitist' - the best selectionEliteCount members survive and the rest of the survivors are selected with tournaments
+			# 'tournament' - every survivor is the best of selectionTournamentSize randomly picked members
+			# 'roulette' - members survive with a probability proportional to their score (shifted so the worst member still has a small chance)
+			# A custom scheme can be a function( scores, survivors, random ) which returns a list of unique indexes of the survivors.
+		if not callable( self.selectionScheme ) and self.selectionScheme not in ( "truncation", "elitist", "tournament", "roulette" ):
+			raise ValueError( "Invalid selectionScheme: {}".format( self.selectionScheme ) )
+		self.selectionTournamentSize = int( _parameters.get( "selectionTournamentSize", 2 ) ) # The number of members that compete in each tournament of the 'elitist' and 'tournament' schemes [1 <= integer < inf]
+		self.selectionEliteCount = int( _parameters.get( "selectionEliteCount", 1 ) ) # The number of best members that always survive with the 'elitist' scheme [0 <= integer < inf]
+		self.fitnessCacheSize = int( _parameters.get( "fitnessCacheSize", 0 ) )
+			# The number of scores to remember, so members that are bred again don't have to be scored again [0 for disabled, else 1 <= integer < inf].
+			# Schedules that are the same except shifted in time share one entry (see printBestNormalized), the 'asap' and 'alap' parts of the score are corrected for the shift.
+		self.fitnessCache = FitnessCache( self.fitnessCacheSize, _parameters.get( "fitnessCacheEviction", "lru" ) ) if self.fitnessCacheSize > 0 else None # [FitnessCache or None]. The hits and misses can be checked with fitnessCache.statistics()
+		self.deltaScoringThreshold = float( _parameters.get( "deltaScoringThreshold", 0.0 ) )
+			# When a new member differs from one of its parents in only a few operations, it can be scored incrementally - starting from the parent's score, only the relations touching the changed operations and the resources they use are scored again.
+			# This is the largest share of changed operations for which this is done [0.0 for disabled, else 0.0 < float <= 1.0]. The scores are exactly the same as with full scoring.
+		self.scoringWorkers = int( _parameters.get( "scoringWorkers", 0 ) )
+			# The number of worker processes that score the population in parallel [0 for scoring in this process, else 2 <= integer < inf]. The members to score are split into one chunk per worker.
+			# This pays off for large populations (a few hundred members or more), for small ones sending the members to the workers takes longer than scoring them. The pool is started on first use and stopped with close().
+		self.scoringPool = None # [multiprocessing.Pool or None]
+		self.evaluator = _parameters.get( "evaluator", None )
+			# What scores the members [None for the built-in scoring, or a function]. The function gets two lists, the start times and the resources of a batch of members (lists of integers), and returns a list with the score of every member,
+			# either an integer or a tuple of ( score, score_operationRelations, score_resourceSuccession, score_fastestResource ). GAS.evaluate is the built-in scoring in this form.
+			# Scores are stored as integers, so a score with a fractional part (e.g. 0.5) raises a ValueError instead of being truncated - scale such scores to integers first, e.g. round( score * 1000 ).
+			# The fitness cache, incremental scoring and scoring workers are part of the built-in scoring and are not used with a function. To score members outside of the solver altogether, use ask() and tell().
+		self.pending = set() # The members given by ask() that are still waiting for their scores
+		self.populationToken = 0 # A number that changes whenever the population is replaced (by breeding or reset), so that tell() can recognize members given by ask() for an earlier population
+		self.sharedMemory = bool( _parameters.get( "sharedMemory", False ) ) # If True, the start times, resources and scores of the population are kept in shared memory blocks (see Population.share), which the scoring workers read and write directly, instead of receiving and returning copies [boolean]. The blocks are freed by close(), reset() and when the interpreter exits.
+		self.randomSeed = _parameters.get( "randomSeed", None ) # The seed for all random numbers used by the solver [None for a different run every time, else 0 <= integer < inf]. Two instances with the same parameters and the same seed produce exactly the same runs.
+		self.random = RandomStream( self.randomSeed ) # All random numbers are taken from here, they are drawn in bulk so that the overhead of calling the generator is paid once per many numbers
+		
+		self.operationDurations = {}
+			# A definition of how much time each operation takes to complete. [dictionary] This is a unitless definition using integers. The meaning is assigned by the user, e.g. 1 can be one minute, one hour, one day, one 15-minute chunk, etc. Each operation duration can be defined in one of two different ways:
+			# 1) If all resources take the same amount of time to complete the operation then [1 <= integer < inf]
+			# 2) If different resources complete the operation in different amount of time then [list of integers, where the index matches the resource index]
+		for i in _parameters[ "operationDurations" ]:
+			if type( _parameters[ "operationDurations" ][ i ] ) is int:
+				self.operationDurations[ i ] = int( _parameters[ "operationDurations" ][ i ] )
+			elif type( _parameters[ "operationDurations" ][ i ] ) is list:
+				self.operationDurations[ i ] = list( _parameters[ "operationDurations" ][ i ] ) # copy by value not by reference
+			else:
+				print( "{}\tInvalid operation duration: {}, type: {}\nTerminating".format( dtnow(), _parameters[ "operationDurations" ][ i ], type( _parameters[ "operationDurations" ][ i ] ) ) )
+				return False
+		
+		self.operationCount = len( self.operationDurations ) # The number of operations [1 <= integer < inf]
+		
+		self.durationMatrix = [] # The operation durations normalized to a dense matrix [list of lists of integers], so that durationMatrix[ op ][ r ] is the duration of operation 'op' on resource 'r' regardless of how it was defined
+		for op in range( self.operationCount ):
+			if type( self.operationDurations[ op ] ) is int:
+				self.durationMatrix.append( [ self.operationDurations[ op ] ] * self.resourceCount )
+			elif len( self.operationDurations[ op ] ) >= self.resourceCount:
+				self.durationMatrix.append( [ int( d ) for d in self.operationDurations[ op ][ : self.resourceCount ] ] )
+			else:
+				raise ValueError( "Operation {} has {} durations, but there are {} resources".format( op, len( self.operationDurations[ op ] ), self.resourceCount ) )
+		self.resourceConflicts = ResourceConflicts( self.durationMatrix, self.weightResourceSuccession, self.resourceConflictMode ) # [ResourceConflicts] scores the Resource Succession and lists the conflicting operations
+		
+		self.operationRelations = {}
+			# A dictionary of two more nested dictionaries that stores operation relations. The structure is operationRelations[ op2 ][ op1 ][ parameter ], where:
+			# 'op2' is the second operation in the relation
+			# 'op1' is the first operation in the relation
+			# 'parameter' can be either of four types of parameters:
+			# 	- 'type' - available types or relations are:
+			# 		- 'SS' - start-to-start - the start of the first operation relates to the start of the second operation
+			# 		- 'SE' - start-to-end - the start of the first operation relates to the end of the second operation
+			# 		- 'ES' - end-to-start - the end of the first operation relates to the start of the second operation
+			# 		- 'EE' - end-to-end - the end of the first operation relates to the end of the second operation
+			# 	- 'min' - the minimum time for the relation (for example, if the relation type is 'ES' and the min time is 10, it means that the second operation should start 10 units of time after the end of the first operation or later, but not sooner)
+			# 	- 'max' - the maximum time for the relation (for example, if the relation type is 'ES' and the min time is 30, it means that the second operation should start 30 units of time after the end of the first operation or sooner, but not later)
+			# 	- 'weight' - a custom weight used to fine-tune the scoring of schedules, default is 1
+		
+		for op2 in _parameters[ "operationRelations" ]: # copy by value not by reference
+			self.operationRelations[ op2 ] = {}
+			for op1 in _parameters[ "operationRelations" ][ op2 ]:
+				self.operationRelations[ op2 ][ op1 ] = dict( _parameters[ "operationRelations" ][ op2 ][ op1 ] )
+		
+		# Evaluate the asapAlapMode
+		for op2 in self.operationRelations:
+			for op1 in self.operationRelations[ op2 ]:
+				if self.asapAlapMode == "normal":
+					if self.operationRelations[ op2 ][ op1 ][ "min" ] == None and self.operationRelations[ op2 ][ op1 ][ "max" ] == None:
+						# If the mode is 'normal' and min and max are not specified, then we need at leas a min definition
+						self.operationRelations[ op2 ][ op1 ][ "min" ] = 0
+				elif self.asapAlapMode == "asap":
+					if self.operationRelations[ op2 ][ op1 ][ "min" ] != None:
+						# If the mode is 'asap' then we want to score solutions as if there is no later execution allowed
+						self.operationRelations[ op2 ][ op1 ][ "max" ] = int( self.operationRelations[ op2 ][ op1 ][ "min" ] )
+				elif self.asapAlapMode == "alap":
+					if self.operationRelations[ op2 ][ op1 ][ "max" ] != None:
+						# If the mode is 'alap' then we want to score solutions as if there is no early execution allowed
+						self.operationRelations[ op2 ][ op1 ][ "min" ] = int( self.operationRelations[ op2 ][ op1 ][ "max" ] )
+		
+		self.operationMaxTime = 0 # The longest possible solution [1 <= integer < inf]. This is used later to find what the minimum lenght of the genome is in order to allow to represent all possible solutions
+		for op in range( self.operationCount ): # It is a sum of all operation durations...
+			if type( self.operationDurations[ op ] ) is int:
+				self.operationMaxTime += self.operationDurations[ op ]
+			else:
+				self.operationMaxTime += max( self.operationDurations[ op ] )
+		for op2 in self.operationRelations: # ...plus the sum of the largest relation offsets
+			for op1 in self.operationRelations[ op2 ]:
+				rel_min = self.operationRelations[ op2 ][ op1 ][ "min" ] if self.operationRelations[ op2 ][ op1 ][ "min" ] != None else 0
+				rel_max = self.operationRelations[ op2 ][ op1 ][ "max" ] if self.operationRelations[ op2 ][ op1 ][ "max" ] != None else 0
+				self.operationMaxTime += max( abs( rel_min ), abs( rel_max ) )
+		
+		self.compileRelations()
+		
+		if self.scoringBackend == "numpy":
+			if np is None:
+				raise ImportError( "scoringBackend 'numpy' requires NumPy to be installed" )
+			self.compileNumpyTables()
+		elif self.scoringBackend != "python":
+			raise ValueError( "Invalid scoringBackend: {}".format( self.scoringBackend ) )
+		
+		if self.genomeStorage == "packed":
+			if np is None:
+				raise ImportError( "genomeStorage 'packed' requires NumPy to be installed" )
+			self.npRandom = self.random.generator # the packed genomes draw whole arrays of random numbers, from the same seeded generator
+		
+		# The layout of the genome. Every operation has a segment of genomeStartBits bits for the start time followed by genomeResourceBits bits for the resource id.
+		if self.genomeEncoding == "unary":
+			self.genomeStartBits = self.operationMaxTime
+			self.genomeResourceBits = self.resourceCount - 1 if self.resourceCount > 1 else 1
+		else:
+			self.genomeStartBits = max( self.operationMaxTime.bit_length(), 1 ) # the same as ceil( log2( operationMaxTime + 1 ) )
+			self.genomeResourceBits = max( ( self.resourceCount - 1 ).bit_length(), 1 )
+		self.genomeSegment = self.genomeStartBits + self.genomeResourceBits
+		self.genomeLength = self.genomeSegment * self.operationCount
+		
+		# When two genomes are combined into a new one, this is done by splitting both genomes in steps. crossMinStep defines the minimum length of the step and crossMaxStep defines the maximum lenght of the step. crossMinStep must be less than or equal to crossMaxStep. They can be defined in one of two ways:
+		# If expressed as [0.0 <= float <= 1.0] then it represents the size of the step relative to the genome length (which depends on genomeEncoding)
+		# If expressed as [0 <= integer < inf] then it is an exact number of characters (zeroes or ones)
+		# When operatorMode is 'integer', the steps are counted in operations instead of characters, so the relative size is calculated against the number of operations
+		self.crossMinStep = self.calculateCrossStep( _parameters[ "crossMinStep" ] )
+		self.crossMaxStep = self.calculateCrossStep( _parameters[ "crossMaxStep" ] )
+		
+		# When operatorMode is 'integer', this is the size of a start time mutation. If expressed as [0.0 <= float <= 1.0] then it is relative to operationMaxTime, if expressed as [1 <= integer < inf] then it is an exact number of time units.
+		mutationStep = _parameters.get( "mutationStep", 0.05 )
+		self.mutationStep = max( int( round( self.operationMaxTime * mutationStep ) ), 1 ) if type( mutationStep ) is float else int( mutationStep )
+		
+		self.population = Population( self.operationCount, self.populationSize + self.infuseRandomToPopulation )
+		self.offspring = Population( self.operationCount, self.populationSize + self.infuseRandomToPopulation )
+	
+	# only reset runtime data so the model can be run again, but keep the parameters
+	def reset( self ):
+		self.population.clear()
+		self.offspring.clear()
+		self.population.unshare() # free the shared memory, it is created again when needed. The scoring workers keep running, the problem they were given hasn't changed.
+		self.offspring.unshare()
+		self.history.clear()
+		self.averageScoreSample = []
+		self.averageScore = None
+		self.generation = 0
+		self.best = None
+		self.bestGeneration = 0
+		self.pending = set()
+		self.populationToken += 1
+		
+	# stop the scoring workers, if they were started, and free the shared memory. The instance can still be used, both are created again when needed.
+	def close( self ):
+		if self.scoringPool is not None:
+			self.scoringPool.terminate()
+			self.scoringPool.join()
+			self.scoringPool = None
+		self.population.unshare()
+		self.offspring.unshare()
+		return True
+	
+	# The attributes needed to score members, i.e. the problem definition after it was compiled. This is what the scoring workers get.
+	def compiledProblem( self ):
+		names = [ "operationCount", "scoringBackend", "durationMatrix", "resourceConflicts", "relationCount",
+			"relationOp1", "relationOp2", "relationStart1", "relationStart2", "relationMin", "relationMax", "relationHasMin", "relationHasMax", "relationWeight", "relationAsap", "relationAlap" ]
+		if self.scoringBackend == "numpy":
+			names += [ "npDurations", "npRelations" ]
+		return { name: getattr( self, name ) for name in names }
+	
+	# convert crossMinStep or crossMaxStep from relative (float) to absolute (integer) terms, the relative size is calculated against the actual genome length
+	def calculateCrossStep( self, _step ):
+		length = self.operationCount if self.operatorMode == "integer" else self.genomeLength
+		if type( _step ) is float:
+			return max( int( round( length * _step ) ), 1 ) # at least one bit (or operation), otherwise the genomes could never be crossed
+		return int( _step )
+	
+	# for a given operation (and resource) return the duration of the operation
+	def getOperationDuration( self, _op, _r = 0 ):
+		return self.durationMatrix[ _op ][ _r ]
+	
+	# add n number of random individuals to the population
+	def addRandomToPopulation( self, _n ):
+		for n in range( _n ):
+			start_times = self.random.randints( 0, self.operationMaxTime, self.operationCount )
+			resources = self.random.randints( 0, self.resourceCount - 1, self.operationCount )
+			
+			if self.historyKeep == True:
+				for i in range( self.historyRetryCount ):
+					if self.history.add( fingerprint( start_times, resources ) ):
+						break
+					start_times = self.random.randints( 0, self.operationMaxTime, self.operationCount )
+					resources = self.random.randints( 0, self.resourceCount - 1, self.operationCount )
+			
+			self.population.append( start_times, resources )
+			
+		return True
+	
+	# Compile operationRelations into flat arrays (one list per field, one entry per relation), so scoring doesn't need to look up nested dictionaries or compare strings for every relation of every member.
+	# Each relation compares a point in time of op1 (its start or its end) plus an offset, with a point in time of op2 (its start or its end):
+	# 	- 'SS' - start of op1 vs start of op2
+	# 	- 'SE' - start of op1 vs end of op2
+	# 	- 'ES' - end of op1 vs start of op2 (one of the most common type of relations, op2 cannot start until op1 has ended)
+	# 	- 'EE' - end of op1 vs end of op2
+	def compileRelations( self ):
+		self.relationOp1 = [] # the index of the first operation in the relation
+		self.relationOp2 = [] # the index of the second operation in the relation
+		self.relationStart1 = [] # 1 if the start of op1 is used, 0 if the end of op1 is used
+		self.relationStart2 = [] # 1 if the start of op2 is used, 0 if the end of op2 is used
+		self.relationMin = [] # the min offset, 0 if there is no min offset
+		self.relationMax = [] # the max offset, 0 if there is no max offset
+		self.relationHasMin = [] # True if the min offset is checked
+		self.relationHasMax = [] # True if the max offset is checked
+		self.relationWeight = [] # the weight of the relation
+		self.relationAsap = [] # True if there is no min offset and the mode is 'asap', in which case the start of op2 is subtracted from the score - the sooner all operations start the better the score will be
+		self.relationAlap = [] # True if there is no max offset and the mode is 'alap', in which case the start of op2 is added to the score - the later all operations start the better the score will be
+		
+		for op2 in self.operationRelations:
+			for op1 in self.operationRelations[ op2 ]:
+				relation = self.operationRelations[ op2 ][ op1 ]
+				if relation[ "type" ] not in ( "SS", "SE", "ES", "EE" ):
+					raise ValueError( "Invalid relation type {} at self.operationRelations[ {} ][ {} ][ 'type' ]".format( relation[ "type" ], op2, op1 ) )
+				self.relationOp1.append( int( op1 ) )
+				self.relationOp2.append( int( op2 ) )
+				self.relationStart1.append( 1 if relation[ "type" ][ 0 ] == "S" else 0 )
+				self.relationStart2.append( 1 if relation[ "type" ][ 1 ] == "S" else 0 )
+				self.relationMin.append( int( relation[ "min" ] ) if relation[ "min" ] != None else 0 )
+				self.relationMax.append( int( relation[ "max" ] ) if relation[ "max" ] != None else 0 )
+				self.relationHasMin.append( relation[ "min" ] != None )
+				self.relationHasMax.append( relation[ "max" ] != None )
+				self.relationWeight.append( int( relation[ "weight" ] ) )
+				self.relationAsap.append( relation[ "min" ] == None and self.asapAlapMode == "asap" )
+				self.relationAlap.append( relation[ "max" ] == None and self.asapAlapMode == "alap" )
+		
+		self.relationCount = len( self.relationOp1 )
+		self.operationRelationIndex = [ [] for op in range( self.operationCount ) ] # for every operation, the indexes of the relations it is part of, so that only those have to be scored again when the operation changes
+		for k in range( self.relationCount ):
+			self.operationRelationIndex[ self.relationOp1[ k ] ].append( k )
+			if self.relationOp2[ k ] != self.relationOp1[ k ]:
+				self.operationRelationIndex[ self.relationOp2[ k ] ].append( k )
+		self.relationShiftSlope = sum( self.relationAlap ) - sum( self.relationAsap ) # when a whole schedule is shifted later by one unit of time, the score changes by this much (only the 'asap' and 'alap' parts depend on absolute time)
+		return True
+	
+	# Score the members of the population that don't have a score yet (see Population.dirty). Survivors keep their score from the previous scoring, so they are not scored again.
+	def scorePopulation( self ):
+		population = self.population
+		rows = population.dirtyRows()
+		
+		if self.evaluator is not None:
+			if len( rows ) > 0:
+				self.applyScores( rows, self.evaluator( [ list( population.start_times[ i ] ) for i in rows ], [ list( population.resources[ i ] ) for i in rows ] ) )
+			return True
+		
+		if self.fitnessCache is not None: # take whatever scores are in the cache and only score the rest
+			keys = {}
+			missing = []
+			for i in rows:
+				shift, keys[ i ] = self.getCacheKey( population.start_times[ i ], population.resources[ i ] )
+				cached = self.fitnessCache.get( keys[ i ] )
+				if cached is None:
+					missing.append( i )
+				else: # the cache holds the score of the schedule shifted to start at 0, so shift it back
+					population.setScore( i, ( cached[ 0 ] + shift * self.relationShiftSlope, cached[ 1 ] + shift * self.relationShiftSlope, cached[ 2 ], cached[ 3 ] ) )
+			rows = missing
+		
+		if self.deltaScoringThreshold > 0:
+			rows = self.scoreFromParents( rows ) # the members that can't be scored incrementally are returned
+		
+		if self.scoringWorkers > 1 and len( rows ) > 1:
+			self.scorePopulationParallel( rows )
+		elif self.scoringBackend == "numpy":
+			self.scorePopulationNumpy( rows )
+		else:
+			for i in rows: # for every member of the population do the below:
+				population.setScore( i, self.scoreIndividual( population.start_times[ i ], population.resources[ i ] ) )
+		
+		if self.fitnessCache is not None:
+			for i in missing: # also the members scored incrementally by scoreFromParents
+				shift = min( population.start_times[ i ] )
+				self.fitnessCache.put( keys[ i ], ( population.score[ i ] - shift * self.relationShiftSlope, population.score_operationRelations[ i ] - shift * self.relationShiftSlope, population.score_resourceSuccession[ i ], population.score_fastestResource[ i ] ) )
+		return True
+	
+	# Score the members listed in _rows with the scoring workers. The rows are split into one chunk per worker, and each chunk is sent as two flat arrays of integers.
+	def scorePopulationParallel( self, _rows ):
+		population = self.population
+		if self.sharedMemory:
+			population.share() # also before the workers are started, so that they use the resource tracker of this process, which frees the blocks only when this process exits
+		if self.scoringPool is None:
+			self.scoringPool = multiprocessing.Pool( self.scoringWorkers, initScoringWorker, ( self.compiledProblem(), ) )
+		size = -( -len( _rows ) // self.scoringWorkers ) # round up, so there are no more chunks than workers
+		if self.sharedMemory:
+			return self.scoreSharedRows( _rows, size )
+		chunks = [ _rows[ i : i + size ] for i in range( 0, len( _rows ), size ) ]
+		tasks = []
+		for chunk in chunks:
+			start_times = array( "q" )
+			resources = array( "q" )
+			for i in chunk:
+				start_times.extend( population.start_times[ i ] )
+				resources.extend( population.resources[ i ] )
+			tasks.append( ( start_times, resources, len( chunk ) ) )
+		for chunk, scores in zip( chunks, self.scoringPool.starmap( scoreChunk, tasks ) ):
+			for n, i in enumerate( chunk ):
+				population.setScore( i, tuple( scores[ 4 * n : 4 * n + 4 ] ) )
+		return True
+	
+	# The shared memory variant of scorePopulationParallel. The members already are where the workers read them, so every worker only gets the bounds of the runs of consecutive rows in its chunk and writes the scores in place.
+	def scoreSharedRows( self, _rows, _size ):
+		population = self.population
+		buffers = ( population.buffers.capacity, population.buffers.names() )
+		tasks = []
+		for k in range( 0, len( _rows ), _size ):
+			chunk = _rows[ k : k + _size ]
+			lo = chunk[ 0 ]
+			for previous, i in zip( chunk, chunk[ 1 : ] + [ None ] ):
+				if i != previous + 1: # the end of a run of consecutive rows
+					tasks.append( ( buffers, lo, previous + 1 ) )
+					lo = i
+		self.scoringPool.starmap( scoreSharedSlots, tasks )
+		for i in _rows:
+			population.dirty[ i ] = False # the scores are already in the score columns
+		return True
+	
+	# The built-in scoring as an evaluator (see the evaluator parameter): score the members given by the lists of their start times and resources, returns a list of ( score, score_operationRelations, score_resourceSuccession, score_fastestResource ) tuples
+	def evaluate( self, _start_times, _resources ):
+		if self.scoringBackend == "numpy" and len( _start_times ) > 0:
+			return list( zip( *( scores.tolist() for scores in self.scoreArraysNumpy( np.array( _start_times, dtype = np.int64 ), np.array( _resources, dtype = np.int64 ) ) ) ) )
+		return [ self.scoreIndividual( start_times, resources ) for start_times, resources in zip( _start_times, _resources ) ]
+	
+	# Set the scores of the members listed in _rows, a score is either a number or a tuple of the score breakdown. When only a number is given, the parts of the breakdown are 0.
+	# The scores have to be integers (an integral float like 3.0 is accepted), see the evaluator parameter. If any score is not, none of the scores are set.
+	def applyScores( self, _rows, _scores ):
+		_scores = list( _scores )
+		if len( _scores ) != len( _rows ):
+			raise ValueError( "Expected {} scores, got {}".format( len( _rows ), len( _scores ) ) )
+		breakdowns = [ ( self.scoreToInt( score ), 0, 0, 0 ) if isinstance( score, numbers.Real ) else tuple( self.scoreToInt( s ) for s in score ) for score in _scores ]
+		for i, breakdown in zip( _rows, breakdowns ):
+			self.population.setScore( i, breakdown )
+		return True
+	
+	# _score as an integer, a score with a fractional part is rejected rather than silently truncated
+	def scoreToInt( self, _score ):
+		if _score != int( _score ):
+			raise ValueError( "Scores must be integers, got {}. Scale the scores to integers first, e.g. round( score * 1000 )".format( _score ) )
+		return int( _score )
+	
+	# The ask / tell interface, for scoring members outside of the solver, e.g. in batches by an external simulator. ask() gives the members that need a score, and tell() gives the scores back. When all members of a generation have their scores, the next ask() breeds the next generation.
+	# Returns at most _n members (None for all of them) that have not been asked for yet, as a list of dictionaries { 'id', 'generation', 'token', 'start_times', 'resources' }. Several batches can be asked for before their scores are told.
+	# An empty list means that all members are waiting for their scores.
+	def ask( self, _n = None ):
+		if len( self.population ) == 0:
+			self.addRandomToPopulation( self.populationSize )
+		rows = self.population.dirtyRows()
+		if len( rows ) == 0: # the whole generation is scored
+			self.breedPopulation()
+			rows = self.population.dirtyRows()
+		rows = [ i for i in rows if i not in self.pending ][ : _n ]
+		self.pending.update( rows )
+		return [ { "id": i, "generation": self.generation, "token": self.populationToken, "start_times": list( self.population.start_times[ i ] ), "resources": list( self.population.resources[ i ] ) } for i in rows ]
+	
+	# Give the _scores [list of integers or score breakdown tuples of integers] of the _candidates [list of dictionaries] returned by ask(), in the same order. Only candidates of the current population that are still waiting for their scores are accepted.
+	# A score with a fractional part raises a ValueError, see applyScores.
+	def tell( self, _candidates, _scores ):
+		for candidate in _candidates:
+			if candidate[ "token" ] != self.populationToken:
+				raise ValueError( "Candidate {} is from generation {}, which has been replaced since".format( candidate[ "id" ], candidate[ "generation" ] ) )
+			if candidate[ "id" ] not in self.pending:
+				raise ValueError( "Candidate {} is not waiting for a score".format( candidate[ "id" ] ) )
+		rows = [ candidate[ "id" ] for candidate in _candidates ]
+		self.applyScores( rows, _scores )
+		self.pending.difference_update( rows )
+		return True
+	
+	# Score incrementally the members listed in _rows which differ from one of their parents in at most deltaScoringThreshold of the operations. The parents are in self.offspring, where the previous population stays until the next one is bred. Returns the rows that were not scored.
+	def scoreFromParents( self, _rows ):
+		population = self.population
+		parents = self.offspring
+		limit = int( self.deltaScoringThreshold * self.operationCount )
+		remaining = []
+		for i in _rows:
+			start_times = population.start_times[ i ]
+			resources = population.resources[ i ]
+			closest = None
+			for p in population.parents[ i ] or ():
+				if p < len( parents ) and not parents.dirty[ p ]: # the parent is still there and it has a score
+					changed = [ op for op, ( st, pst, r, pr ) in enumerate( zip( start_times, parents.start_times[ p ], resources, parents.resources[ p ] ) ) if st != pst or r != pr ]
+					if closest is None or len( changed ) < len( closest[ 1 ] ):
+						closest = ( p, changed )
+			if closest is None or len( closest[ 1 ] ) > limit:
+				remaining.append( i )
+				continue
+			p, changed = closest
+			breakdown = ( parents.score[ p ], parents.score_operationRelations[ p ], parents.score_resourceSuccession[ p ], parents.score_fastestResource[ p ] )
+			population.setScore( i, self.scoreIndividualDelta( start_times, resources, parents.start_times[ p ], parents.resources[ p ], breakdown, changed ) )
+		return remaining
+	
+	# Score a member incrementally from the score breakdown of a similar member (its parent) and the list of operations that are different. Returns the same tuple as scoreIndividual.
+	def scoreIndividualDelta( self, _start_times, _resources, _parent_start_times, _parent_resources, _parent_breakdown, _changed ):
+		if len( _changed ) == 0:
+			return tuple( _parent_breakdown )
+		
+		# Operation Relations - only the relations that touch a changed operation
+		relations = set()
+		for op in _changed:
+			relations.update( self.operationRelationIndex[ op ] )
+		score_operationRelations = _parent_breakdown[ 1 ]
+		for k in relations:
+			score_operationRelations += self.scoreRelation( k, _start_times, _resources ) - self.scoreRelation( k, _parent_start_times, _parent_resources )
+		
+		# Resource Succession - only the resources that a changed operation was moved from or to
+		affected = set( _resources[ op ] for op in _changed ) | set( _parent_resources[ op ] for op in _changed )
+		score_resourceSuccession = _parent_breakdown[ 2 ] + self.scoreResources( _start_times, _resources, affected ) - self.scoreResources( _parent_start_times, _parent_resources, affected )
+		
+		# Fastest Resource - only the durations of the changed operations
+		score_fastestResource = _parent_breakdown[ 3 ]
+		for op in _changed:
+			score_fastestResource -= self.durationMatrix[ op ][ _resources[ op ] ] - self.durationMatrix[ op ][ _parent_resources[ op ] ]
+		
+		return score_operationRelations + score_resourceSuccession + score_fastestResource, score_operationRelations, score_resourceSuccession, score_fastestResource
+	
+	# The score of a single relation k, the same as one step of the Operation Relations loop in scoreIndividual
+	def scoreRelation( self, _k, _start_times, _resources ):
+		op1 = self.relationOp1[ _k ]
+		op2 = self.relationOp2[ _k ]
+		first = _start_times[ op1 ] if self.relationStart1[ _k ] else _start_times[ op1 ] + self.durationMatrix[ op1 ][ _resources[ op1 ] ]
+		second = _start_times[ op2 ] if self.relationStart2[ _k ] else _start_times[ op2 ] + self.durationMatrix[ op2 ][ _resources[ op2 ] ]
+		score = 0
+		if self.relationHasMin[ _k ]:
+			threshold_min = second - ( first + self.relationMin[ _k ] )
+			if threshold_min < 0: score += threshold_min * self.relationWeight[ _k ]
+		if self.relationHasMax[ _k ]:
+			threshold_max = ( first + self.relationMax[ _k ] ) - second
+			if threshold_max < 0: score += threshold_max * self.relationWeight[ _k ]
+		if self.relationAsap[ _k ]: score -= _start_times[ op2 ]
+		if self.relationAlap[ _k ]: score += _start_times[ op2 ]
+		return score
+	
+	# The Resource Succession score of the resources listed in _resourceIds only. Each resource is scored on its own, so the score of a member is the sum of the scores of its resources.
+	def scoreResources( self, _start_times, _resources, _resourceIds ):
+		return self.resourceConflicts.penalty( _start_times, _resources, _resourceIds )
+	
+	# The key of a member in the fitness cache is the fingerprint of its schedule normalized to start at time 0. Returns the shift (the earliest start time) and the key.
+	def getCacheKey( self, _start_times, _resources ):
+		shift = min( _start_times )
+		return shift, fingerprint( [ st - shift for st in _start_times ], _resources )
+	
+	# Score one member of the population. Returns a tuple of ( score, score_operationRelations, score_resourceSuccession, score_fastestResource ), where 'score' is the main score used and the rest is just to see each scoring method separately.
+	def scoreIndividual( self, _start_times, _resources ):
+		durations = [ row[ r ] for row, r in zip( self.durationMatrix, _resources ) ] # gather the duration of every operation on its assigned resource from the duration matrix
+		end_times = [ s + d for s, d in zip( _start_times, durations ) ]
+		times = ( end_times, _start_times ) # times[ 1 ] is the start time and times[ 0 ] is the end time, this matches the relationStart1 and relationStart2 flags
+		
+		# Operation Relations - This section will score members based on whether the operation relations are violated or not
+		score_operationRelations = 0
+		for op1, op2, start1, start2, rel_min, rel_max, has_min, has_max, weight, asap, alap in zip(
+				self.relationOp1, self.relationOp2, self.relationStart1, self.relationStart2, self.relationMin, self.relationMax,
+				self.relationHasMin, self.relationHasMax, self.relationWeight, self.relationAsap, self.relationAlap ):
+			first = times[ start1 ][ op1 ]
+			second = times[ start2 ][ op2 ]
+			if has_min: # the second point in time should be greater than the first one plus the min offset...
+				threshold_min = second - ( first + rel_min )
+				if threshold_min < 0: score_operationRelations += threshold_min * weight # ... otherwise, subtract (it is already negative) the difference from the score adjusted by the specific weight for this relation. In this way the smaller the violation of the min offset, the better the score.
+			if has_max: # the second point in time should be no greater than the first one plus the max offset...
+				threshold_max = ( first + rel_max ) - second
+				if threshold_max < 0: score_operationRelations += threshold_max * weight # ... otherwise, subtract the difference in the same way
+			if asap: score_operationRelations -= _start_times[ op2 ]
+			if alap: score_operationRelations += _start_times[ op2 ]
+		
+		# Resource Succession - This section will score members based on whether resources have been assigned one operation at a time or not
+		# The operations of every resource are swept in the order of their start times, and every operation that starts before another one on the same resource has finished reduces the score by weightResourceSuccession (see resourceConflictMode)
+		score_resourceSuccession = self.resourceConflicts.penalty( _start_times, _resources )
+		
+		# Fastest Resource - This section will score members based on whether operations are being assigned to the resources that will execute them the fastest
+		# It simply means subtracting the operation duration of the currently assigned resource from the total score. Thus, schedules where fastest resources are used will have higher scores overall.
+		# The durations were already gathered from the duration matrix above, so this is just one sum.
+		score_fastestResource = -sum( durations )
+		
+		return score_operationRelations + score_resourceSuccession + score_fastestResource, score_operationRelations, score_resourceSuccession, score_fastestResource
+	
+	# Build the arrays used by scorePopulationNumpy. This is done only once, when the instance is created, because the problem definition doesn't change.
+	def compileNumpyTables( self ):
+		# operation x resource matrix of durations, so the duration of every operation of every member can be looked up in one go
+		self.npDurations = np.array( self.durationMatrix, dtype = np.int64 )
+		
+		# the compiled relations as NumPy arrays
+		self.npRelations = {}
+		for key, column in ( ( "op1", self.relationOp1 ), ( "op2", self.relationOp2 ), ( "min", self.relationMin ), ( "max", self.relationMax ), ( "weight", self.relationWeight ) ):
+			self.npRelations[ key ] = np.array( column, dtype = np.int64 )
+		for key, column in ( ( "start1", self.relationStart1 ), ( "start2", self.relationStart2 ), ( "hasMin", self.relationHasMin ), ( "hasMax", self.relationHasMax ), ( "asap", self.relationAsap ), ( "alap", self.relationAlap ) ):
+			self.npRelations[ key ] = np.array( column, dtype = bool )
+		return True
+	
+	# The same scoring as scoreIndividual, but done for many members at once - all members of the population, or only the members listed in _rows. The members are converted to 2-D arrays where each row is a member and each column is an operation.
+	def scorePopulationNumpy( self, _rows = None ):
+		population = self.population
+		rows = range( len( population ) ) if _rows is None else _rows
+		if len( rows ) == 0:
+			return True
+		
+		start_times = np.array( [ population.start_times[ i ] for i in rows ], dtype = np.int64 )
+		resources = np.array( [ population.resources[ i ] for i in rows ], dtype = np.int64 )
+		score, score_operationRelations, score_resourceSuccession, score_fastestResource = self.scoreArraysNumpy( start_times, resources )
+		for breakdown in zip( rows, score.tolist(), score_operationRelations.tolist(), score_resourceSuccession.tolist(), score_fastestResource.tolist() ):
+			population.setScore( breakdown[ 0 ], breakdown[ 1: ] )
+		return True
+	
+	# Score the members given as 2-D arrays of start times and resources. Returns four arrays, one per part of the score breakdown.
+	def scoreArraysNumpy( self, start_times, resources ):
+		durations = self.npDurations[ np.arange( self.operationCount ), resources ] # the duration of every operation on its assigned resource
+		end_times = start_times + durations
+		
+		# Operation Relations - every relation is a column, so the thresholds of all relations of all members are calculated at once
+		rel = self.npRelations
+		first = np.where( rel[ "start1" ], start_times[ :, rel[ "op1" ] ], end_times[ :, rel[ "op1" ] ] )
+		second = np.where( rel[ "start2" ], start_times[ :, rel[ "op2" ] ], end_times[ :, rel[ "op2" ] ] )
+		threshold_min = np.minimum( second - ( first + rel[ "min" ] ), 0 ) * rel[ "weight" ]
+		threshold_max = np.minimum( ( first + rel[ "max" ] ) - second, 0 ) * rel[ "weight" ]
+		score_operationRelations = np.where( rel[ "hasMin" ], threshold_min, 0 ) + np.where( rel[ "hasMax" ], threshold_max, 0 )
+		score_operationRelations += np.where( rel[ "alap" ], start_times[ :, rel[ "op2" ] ], 0 ) - np.where( rel[ "asap" ], start_times[ :, rel[ "op2" ] ], 0 )
+		score_operationRelations = score_operationRelations.sum( axis = 1 )
+		
+		# Resource Succession - sort every row by resource id and then by start time (the sort is stable, just like list.sort) and sweep all rows at once
+		score_resourceSuccession = self.resourceConflicts.penaltyPopulation( start_times, resources, end_times )
+		
+		# Fastest Resource
+		score_fastestResource = -durations.sum( axis = 1 )
+		
+		score = score_operationRelations + score_resourceSuccession + score_fastestResource
+		return score, score_operationRelations, score_resourceSuccession, score_fastestResource
+	
+	# for every member of the population, calculate a genome by taking start times and resource ids and convering to a string of zeroes and ones
+	def calculatePopulationGenome( self ):
+		population = self.population
+		for n in range( len( population ) ):
+			start_times = population.start_times[ n ]
+			resources = population.resources[ n ]
+			genome = [] # for every operation in the model convert start time and resource id to string and append to the genome in the same order
+			for i in range( self.operationCount ):
+				genome.append( self.encodeValue( start_times[ i ], self.genomeStartBits ) )
+				genome.append( self.encodeValue( resources[ i ], self.genomeResourceBits ) )
+			population.genome[ n ] = "".join( genome )
+		return True
+	
+	# Convert a number to a string of _bits zeroes and ones using the selected genomeEncoding
+	def encodeValue( self, _number, _bits ):
+		if self.genomeEncoding == "unary":
+			return self.numberToString( _number, _bits )
+		number = int( _number )
+		if self.genomeEncoding == "gray":
+			number ^= number >> 1 # reflected Gray code of the number
+		return format( number, "0{}b".format( _bits ) )
+	
+	# This is the opposite of encodeValue. Compact encodings can represent numbers above the highest possible one (e.g. 4 bits can store 15 but operationMaxTime might be 11), such numbers are wrapped around to stay within [0, _maximum]
+	def decodeValue( self, _string, _maximum ):
+		if self.genomeEncoding == "unary":
+			number = _string.count( "1" ) # as previously mentioned, numbers are encoded as the number of ocurrences of 1s
+		else:
+			number = int( _string, 2 )
+			if self.genomeEncoding == "gray": # the binary number is recovered by XOR-ing all the shifted copies of the Gray code
+				shift = number >> 1
+				while shift:
+					number ^= shift
+					shift >>= 1
+		if number > _maximum:
+			number %= _maximum + 1
+		return number
+	
+	# A generic function handles both start time and resource id conversion. This is possible because numbers are encoded as the number of 1s in a string, thus 0010111011 is the number 6 because there are six ones
+	def numberToString( self, _number, _length ): # the functions needs to know the number and the maximum number possible, which is eiher operationMaxTime or resourceCount
+		number = int( _number ) # the number itself, or also the number of ones
+		padding = int( _length - _number ) # padding is the number of zeroes
+		probability = int( round( 100 * ( padding / _length ) ) ) # We want to space out ones and zeroes evenly and we can do this using a probability. For example, we don't want to have 1111110000, instead we want something like 0010111011
+		draws = iter( self.random.randints( 0, 100, number + padding ) ) # the loop below takes at most one random number per character, so they are all drawn at once
+		string = ""
+		while number + padding > 0: # the loop works by consuming the number and the padding, once these are consumed our job is done and the loop stops
+			if number == 0: # if have no more 1s left to assign, then we assign a 0...
+				string += "0"
+				padding -= 1
+				continue # ... and continue because there might be more 0s to assign
+			if padding == 0: # if have no more 0s left to assign, then we assign a 1...
+				string += "1"
+				number -= 1
+				continue # ... and continue because there might be more 1s to assign
+			if next( draws ) < probability: # otherwise, there are still both 1s and 0s to assign, so the probability helps us pick which one to assign next in order to space them evenly
+				string += "0"
+				padding -= 1
+			else:
+				string += "1"
+				number -= 1
+		return string
+		
+	# This is the heart of everything. When this method is called it drives all the logic and processing. One call of the method is equal to one cycle of evolutiom, meaning we start with one population and end up with a different one which s derived from the first one. Needless to say, the order of actions below matters.
+	def breedPopulation( self, do_print = False, print_text = "" ):
+		self.scorePopulation() # first, whatever population we have, we want to score it
+		
+		best = self.trackBest()
+		if do_print: self.printBestNormalized( print_text, best )
+		
+		# this is where we capture information about the average score calculation
+		if self.averageScoreSampleSize > 0:
+			average = sum( self.population.scores() ) # calculate the average score for the whole population
+			average = int( average / self.populationSize )
+			self.averageScoreSample.append( average ) # append it to the list that tracks average score across populations
+			if len( self.averageScoreSample ) > self.averageScoreSampleSize: # if we have more samples than what is defined...
+				del self.averageScoreSample[ 0 ] # ... remove the earliest one and leave the rest
+				self.averageScore = sum( self.averageScoreSample ) / self.averageScoreSampleSize # calculate the average score across populations and save it as current - this can later be printed
+		
+		# we are now in a position where we can discard members from the current population
+		survivors = int( round( self.survivalRate * self.populationSize ) ) # the number of members to keep / survive
+		if self.infuseRandomToPopulation == 0:
+			survivors = max( survivors, 1 ) # the next generation needs at least one parent
+		selected = self.selectSurvivors( self.population.scores(), min( survivors, len( self.population ) ) )
+		selected.sort( key = self.population.score.__getitem__, reverse = True ) # only the survivors are sorted, so the best survivor is first
+		self.population.reorder( selected ) # the survivors are kept and the rest are discarded in one operation
+		
+		# now is the time to add random members to the population if the model specifies so
+		if self.infuseRandomToPopulation > 0:
+			self.addRandomToPopulation( self.infuseRandomToPopulation )
+			#self.calculatePopulationGenome()
+			# the new members are only parents of the next generation, which is scored anyway, so they are not scored here
+		
+		self.offspring.clear() # first we build the new population in the second container and then we swap the two
+		if self.operatorMode == "integer": # no genomes are needed, the members are crossed directly
+			self.breedPopulationIntegers()
+		elif self.genomeStorage == "packed": # the packed genomes are bred for the whole population at once
+			self.breedPopulationPacked()
+		else:
+			self.breedPopulationGenomes()
+		self.population, self.offspring = self.offspring, self.population # the new population becomes the current one, and the storage of the old one will be overwritten by the next generation
+		self.generation += 1
+		self.pending = set() # whatever ask() gave for the old population can't be told anymore
+		self.populationToken += 1
+		
+		return True
+	
+	# Find the best member of the scored population and keep a copy of it in self.best if it is the best one so far. Returns the index of the best member.
+	def trackBest( self ):
+		population = self.population
+		i = max( range( len( population ) ), key = population.score.__getitem__ )
+		if self.best is None or population.score[ i ] > self.best[ "score" ]:
+			self.best = population.getIndividualAsDict( i )
+			self.bestGeneration = self.generation
+		return i
+	
+	# Score the population and describe it in a Snapshot, _start_time is when the evolution started
+	def snapshot( self, _start_time ):
+		self.scorePopulation()
+		i = self.trackBest()
+		population = self.population
+		breakdown = ( population.score[ i ], population.score_operationRelations[ i ], population.score_resourceSuccession[ i ], population.score_fastestResource[ i ] )
+		return Snapshot( self.generation, breakdown, self.averageScore, time.time() - _start_time, Individual( population, i ) )
+	
+	# A generator that scores the population, yields a Snapshot of it, breeds the next generation, and so on. It breeds _generations generations (None for no limit), so it yields _generations + 1 snapshots, the first one of the current population.
+	# The evolution can be observed without printing, and it can be stopped at any time by simply not asking for the next snapshot. For example:
+	# 	for snapshot in solver.evolve():
+	# 		if snapshot.score >= -70: break
+	def evolve( self, _generations = None, do_print = False, print_text = "" ):
+		if len( self.population ) == 0:
+			self.addRandomToPopulation( self.populationSize )
+		start_time = time.time()
+		generations = 0
+		while True:
+			snapshot = self.snapshot( start_time )
+			if do_print: self.printBestNormalized( print_text, snapshot.best.index )
+			yield snapshot
+			if _generations is not None and generations >= _generations:
+				return
+			self.breedPopulation()
+			generations += 1
+	
+	# The same as evolve, but an asynchronous generator for use in an asyncio event loop ('async for snapshot in solver.evolveAsync()'). Every generation is scored and bred in the default executor of the loop, so the loop is not blocked in the meantime.
+	# Cancelling the task that consumes it stops the evolution after the current generation.
+	async def evolveAsync( self, _generations = None, do_print = False, print_text = "" ):
+		loop = asyncio.get_running_loop()
+		if len( self.population ) == 0:
+			self.addRandomToPopulation( self.populationSize )
+		start_time = time.time()
+		generations = 0
+		while True:
+			snapshot = await loop.run_in_executor( None, self.snapshot, start_time )
+			if do_print: self.printBestNormalized( print_text, snapshot.best.index )
+			yield snapshot
+			if _generations is not None and generations >= _generations:
+				return
+			await loop.run_in_executor( None, self.breedPopulation )
+			generations += 1
+	
+	# Breed generations until one of the given limits is reached, the limits that are None are not checked:
+	# 	_maxGenerations - the number of generations to breed
+	# 	_maxSeconds - the time to run for
+	# 	_targetScore - stop as soon as a member with this score or higher is found
+	# 	_stallGenerations - stop when the best score hasn't improved for this many generations
+	# 	_stallAverageGenerations - stop when the averageScore (the moving average over averageScoreSampleSize generations) hasn't improved for this many generations, counted from the first generation that has an averageScore
+	# 	_minDiversity - stop when the diversity of the population (see populationDiversity) drops below this value, i.e. when the population has converged
+	# Returns a dictionary with the 'reason' for stopping (the name of the limit), the number of 'generations' bred, the 'seconds' it took, a copy of the 'best' member found since the last reset, the generation it was found in and the last 'averageScore'.
+	def run( self, _maxGenerations = None, _maxSeconds = None, _targetScore = None, _stallGenerations = None, _stallAverageGenerations = None, _minDiversity = None, do_print = False, print_text = "" ):
+		if _maxGenerations is None and _maxSeconds is None and _targetScore is None and _stallGenerations is None and _stallAverageGenerations is None and _minDiversity is None:
+			raise ValueError( "run needs at least one limit, otherwise it would never stop" )
+		if _stallAverageGenerations is not None and self.averageScoreSampleSize <= 0:
+			raise ValueError( "_stallAverageGenerations needs averageScoreSampleSize to be greater than 0" )
+		start_time = time.time()
+		start_generation = self.generation
+		best_average = None # the best averageScore during this run and the generation when it was reached (the counting starts once the averageScore is known)
+		best_average_generation = None
+		reason = None
+		for snapshot in self.evolve( None, do_print, print_text ):
+			generations = self.generation - start_generation
+			if self.averageScore is not None and ( best_average is None or self.averageScore > best_average ):
+				best_average = self.averageScore
+				best_average_generation = self.generation
+			if _targetScore is not None and self.best[ "score" ] >= _targetScore:
+				reason = "targetScore"
+			elif _stallGenerations is not None and self.generation - self.bestGeneration >= _stallGenerations:
+				reason = "stallGenerations"
+			elif _stallAverageGenerations is not None and best_average is not None and self.generation - best_average_generation >= _stallAverageGenerations:
+				reason = "stallAverageGenerations"
+			elif _minDiversity is not None and self.populationDiversity() < _minDiversity:
+				reason = "minDiversity"
+			elif _maxGenerations is not None and generations >= _maxGenerations:
+				reason = "maxGenerations"
+			elif _maxSeconds is not None and time.time() - start_time >= _maxSeconds:
+				reason = "maxSeconds"
+			if reason is not None:
+				break
+		return { "reason": reason, "generations": generations, "seconds": time.time() - start_time, "best": dict( self.best ), "bestGeneration": self.bestGeneration, "averageScore": self.averageScore }
+	
+	# A measure of how different the members of the population are [0.0 <= float < 1.0]. For every operation, it is the share of members whose start time and resource differ from the most common ones, averaged over all operations.
+	# It is 0.0 when all members are the same schedule, and close to 1.0 when all members are different in every operation.
+	def populationDiversity( self ):
+		population = self.population
+		n = len( population )
+		if n == 0:
+			return 0.0
+		different = 0
+		for op in range( self.operationCount ):
+			counts = {}
+			for i in range( n ):
+				value = ( population.start_times[ i ][ op ], population.resources[ i ][ op ] )
+				counts[ value ] = counts.get( value, 0 ) + 1
+			different += n - max( counts.values() )
+		return different / ( n * self.operationCount )
+	
+	# Select _survivors members based on their _scores [list of integers] using the selectionScheme, returns a list of unique indexes
+	def selectSurvivors( self, _scores, _survivors ):
+		if callable( self.selectionScheme ):
+			selected = list( self.selectionScheme( _scores, _survivors, self.random ) )
+			if len( set( selected ) ) != len( selected ) or any( not 0 <= i < len( _scores ) for i in selected ): # Population.reorder needs unique indexes of existing members
+				raise ValueError( "selectionScheme must return unique indexes in [0, {}), got: {}".format( len( _scores ), selected ) )
+			return selected
+		if self.selectionScheme == "truncation":
+			return self.selectTruncation( _scores, _survivors )
+		if self.selectionScheme == "elitist":
+			elites = self.selectTruncation( _scores, min( self.selectionEliteCount, _survivors ) )
+			return elites + self.selectTournament( _scores, _survivors - len( elites ), elites )
+		if self.selectionScheme == "tournament":
+			return self.selectTournament( _scores, _survivors )
+		return self.selectRoulette( _scores, _survivors )
+	
+	# The best _n members, the partial sort takes O( N log n ) instead of O( N log N ) for sorting the whole population
+	def selectTruncation( self, _scores, _n ):
+		return heapq.nlargest( _n, range( len( _scores ) ), key = _scores.__getitem__ )
+	
+	# Each of the _n winners is the best of selectionTournamentSize randomly picked members. A winner can't compete again, so all winners are unique. Members listed in _exclude don't compete at all.
+	def selectTournament( self, _scores, _n, _exclude = () ):
+		excluded = set( _exclude )
+		candidates = [ i for i in range( len( _scores ) ) if i not in excluded ]
+		winners = []
+		for n in range( min( _n, len( candidates ) ) ):
+			positions = self.random.randints( 0, len( candidates ) - 1, self.selectionTournamentSize )
+			winner = max( positions, key = lambda position: _scores[ candidates[ position ] ] )
+			winners.append( candidates[ winner ] )
+			candidates[ winner ] = candidates[ -1 ] # remove the winner by moving the last candidate in its place
+			candidates.pop()
+		return winners
+	
+	# Roulette wheel selection without repetition. Every member gets a random key u ^ ( 1 / weight ), where the weight is the score shifted to be positive, and the members with the _n largest keys win - this is the same as spinning the roulette wheel _n times and removing each winner from the wheel.
+	def selectRoulette( self, _scores, _n ):
+		lowest = min( _scores ) if _scores else 0
+		keys = [ u ** ( 1.0 / ( score - lowest + 1 ) ) for score, u in zip( _scores, self.random.randoms( len( _scores ) ) ) ]
+		return heapq.nlargest( _n, range( len( _scores ) ), key = keys.__getitem__ )
+	
+	# The breeding part of breedPopulation with genomes stored as strings, the new population is written to self.offspring
+	def breedPopulationGenomes( self ):
+		# create genomes for all members of the current population so we can start breeding the population
+		self.calculatePopulationGenome()
+		
+		genomes = self.population.genome
+		parents = self.random.randints( 0, len( self.population ) - 1, 2 * self.populationSize ) # the parents of all new members are picked at once
+		for n in range( self.populationSize ): # we generate the same number of members for the new population
+			p1 = parents[ 2 * n ] # pick two random members from the current population
+			p2 = parents[ 2 * n + 1 ]
+		
+			genome1 = genomes[ p1 ] # take their genomes
+			genome2 = genomes[ p2 ]
+			
+			new_genome = self.crossTwoGenomes( genome1, genome2 ) # and combine them into a new genome
+			start_times, resources = self.genomeToValues( new_genome ) # then convert the new genome back to start times and resource ids
+			
+			if self.historyKeep == True: # if history tracking is switched on, we need to save the new members to the history log
+				for i in range( self.historyRetryCount ): # 
+					if self.history.add( fingerprint( start_times, resources ) ): # if the new member is not in the history log, then add it, otherwise keep trying to generate a new member until a unique one is found or until the maximum number of tries is exhausted
+						break
+					p1 = self.random.randint( 0, len( self.population ) - 1 )
+					p2 = self.random.randint( 0, len( self.population ) - 1 )
+					new_genome = self.crossTwoGenomes( genomes[ p1 ], genomes[ p2 ] )
+					start_times, resources = self.genomeToValues( new_genome )
+			
+			# add the new member to the new population
+			self.offspring.append( start_times, resources, 0, new_genome, ( p1, p2 ) )
+		
+		return True
+	
+	# The same as breedPopulationGenomes, but the start times and resource ids are crossed and mutated directly
+	def breedPopulationIntegers( self ):
+		parents = self.random.randints( 0, len( self.population ) - 1, 2 * self.populationSize )
+		for n in range( self.populationSize ):
+			p1 = parents[ 2 * n ] # pick two random members from the current population
+			p2 = parents[ 2 * n + 1 ]
+			start_times, resources = self.crossTwoIndividuals( self.population[ p1 ], self.population[ p2 ] )
+			
+			if self.historyKeep == True: # the same retry logic as in breedPopulation
+				for i in range( self.historyRetryCount ):
+					if self.history.add( fingerprint( start_times, resources ) ):
+						break
+					p1 = self.random.randint( 0, len( self.population ) - 1 )
+					p2 = self.random.randint( 0, len( self.population ) - 1 )
+					start_times, resources = self.crossTwoIndividuals( self.population[ p1 ], self.population[ p2 ] )
+			
+			self.offspring.append( start_times, resources, 0, "", ( p1, p2 ) )
+		return True
+	
+	# take two members, combine their start times and resource ids randomly, operation by operation, and return the new start times and resource ids
+	def crossTwoIndividuals( self, _individual1, _individual2 ):
+		start_times1, resources1 = _individual1[ "start_times" ], _individual1[ "resources" ]
+		start_times2, resources2 = _individual2[ "start_times" ], _individual2[ "resources" ]
+		
+		if self.integerCrossover == "uniform": # every operation comes from either member
+			start_times = []
+			resources = []
+			for st1, r1, st2, r2, u in zip( start_times1, resources1, start_times2, resources2, self.random.randoms( self.operationCount ) ):
+				if u < 0.5:
+					start_times.append( st1 )
+					resources.append( r1 )
+				else:
+					start_times.append( st2 )
+					resources.append( r2 )
+		else: # the same as crossTwoGenomes, but the steps are counted in operations
+			start_times = []
+			resources = []
+			index = 0
+			while index < self.operationCount:
+				step = max( self.random.randint( self.crossMinStep, self.crossMaxStep ), 1 )
+				if self.random.random() < 0.5:
+					start_times += start_times1[ index : index + step ]
+					resources += resources1[ index : index + step ]
+				else:
+					start_times += start_times2[ index : index + step ]
+					resources += resources2[ index : index + step ]
+				index += step
+		
+		if self.mutationProbability > 0 and self.random.random() < self.mutationProbability: # here we also implement the mutation feature
+			if type( self.mutationSize ) is float:
+				number_of_mutations = int( round( self.operationCount * self.mutationSize ) ) # relative to the number of operations
+			else:
+				number_of_mutations = int( self.mutationSize )
+			
+			for op in self.random.randints( 0, self.operationCount - 1, number_of_mutations ):
+				if self.random.random() < 0.5: # shift the start time, but keep it within [0, operationMaxTime]
+					if self.integerMutation == "gaussian":
+						shift = int( round( self.random.gauss( 0, self.mutationStep ) ) )
+					else:
+						shift = self.random.randint( -self.mutationStep, self.mutationStep )
+					start_times[ op ] = min( max( start_times[ op ] + shift, 0 ), self.operationMaxTime )
+				else: # or assign a random resource
+					resources[ op ] = self.random.randint( 0, self.resourceCount - 1 )
+		
+		return start_times, resources
+	
+	# The same as breedPopulationGenomes, but with genomes stored in one packed bit matrix. The survivors keep the genomes they were bred from, only the members added since (random or migrated ones) are packed.
+	def breedPopulationPacked( self ):
+		n = len( self.population )
+		genomeMatrix = self.population.genomeMatrix
+		packed = 0 if genomeMatrix is None else len( genomeMatrix )
+		if packed < n:
+			new_genomes = self.packGenomes( self.population.start_times[ packed : n ], self.population.resources[ packed : n ] )
+			genomeMatrix = new_genomes if genomeMatrix is None else np.vstack( ( genomeMatrix, new_genomes ) )
+			self.population.genomeMatrix = genomeMatrix
+		parents1 = self.npRandom.integers( 0, n, self.populationSize ) # pick two random members from the current population for every new member
+		parents2 = self.npRandom.integers( 0, n, self.populationSize )
+		genomes = self.crossGenomesPacked( genomeMatrix[ parents1 ], genomeMatrix[ parents2 ] )
+		start_times, resources = self.unpackGenomes( genomes )
+		start_times = start_times.tolist()
+		resources = resources.tolist()
+		parents = list( zip( parents1.tolist(), parents2.tolist() ) )
+		
+		if self.historyKeep == True: # the same retry logic as in breedPopulation, a duplicate member is replaced by crossing another pair of members
+			for n in range( self.populationSize ):
+				for i in range( self.historyRetryCount ):
+					if self.history.add( fingerprint( start_times[ n ], resources[ n ] ) ):
+						break
+					pair = self.npRandom.integers( 0, len( self.population ), 2 )
+					parents[ n ] = tuple( pair.tolist() )
+					genomes[ n ] = self.crossGenomesPacked( genomeMatrix[ pair[ :1 ] ], genomeMatrix[ pair[ 1: ] ] )[ 0 ]
+					new_start_times, new_resources = self.unpackGenomes( genomes[ n : n + 1 ] )
+					start_times[ n ] = new_start_times[ 0 ].tolist()
+					resources[ n ] = new_resources[ 0 ].tolist()
+		
+		for st, r, pair in zip( start_times, resources, parents ):
+			self.offspring.append( st, r, 0, "", pair )
+		self.offspring.genomeMatrix = genomes # the genomes of the new population
+		return True
+	
+	# Convert start times and resource ids of many members [lists or 2-D arrays, member x operation] to a matrix of packed genomes, one row per member
+	def packGenomes( self, _start_times, _resources ):
+		start_bits = self.encodeBits( np.array( _start_times, dtype = np.int64 ).reshape( -1, self.operationCount ), self.genomeStartBits )
+		resource_bits = self.encodeBits( np.array( _resources, dtype = np.int64 ).reshape( -1, self.operationCount ), self.genomeResourceBits )
+		bits = np.concatenate( ( start_bits, resource_bits ), axis = 2 ) # member x operation x segment, which has the same layout as the string genome
+		return np.packbits( bits.reshape( len( bits ), self.genomeLength ), axis = 1 )
+	
+	# The vectorized counterpart of encodeValue, returns an array of member x operation x _bits
+	def encodeBits( self, _numbers, _bits ):
+		if self.genomeEncoding == "unary":
+			# the 1s are spread randomly within the segment, just like numberToString does - take a random permutation of the bit positions and set the first _number of them
+			positions = np.argsort( self.npRandom.random( _numbers.shape + ( _bits, ) ), axis = 2 )
+			bits = np.zeros( _numbers.shape + ( _bits, ), dtype = np.uint8 )
+			np.put_along_axis( bits, positions, ( np.arange( _bits ) < _numbers[ :, :, None ] ).astype( np.uint8 ), axis = 2 )
+			return bits
+		if self.genomeEncoding == "gray":
+			_numbers = _numbers ^ ( _numbers >> 1 )
+		return ( ( _numbers[ :, :, None ] >> np.arange( _bits - 1, -1, -1 ) ) & 1 ).astype( np.uint8 ) # most significant bit first, like format( number, 'b' )
+	
+	# The opposite of packGenomes, returns two 2-D arrays (member x operation) of start times and resource ids
+	def unpackGenomes( self, _genomes ):
+		bits = np.unpackbits( _genomes, axis = 1, count = self.genomeLength ).reshape( len( _genomes ), self.operationCount, self.genomeSegment )
+		start_times = self.decodeBits( bits[ :, :, : self.genomeStartBits ], self.operationMaxTime )
+		resources = self.decodeBits( bits[ :, :, self.genomeStartBits : ], self.resourceCount - 1 )
+		return start_times, resources
+	
+	# The vectorized counterpart of decodeValue
+	def decodeBits( self, _bits, _maximum ):
+		if self.genomeEncoding == "unary":
+			numbers = _bits.sum( axis = 2, dtype = np.int64 ) # the popcount of every segment
+		else:
+			if self.genomeEncoding == "gray":
+				_bits = np.bitwise_xor.accumulate( _bits, axis = 2 ) # every binary bit is the XOR of all Gray bits up to and including it
+			numbers = _bits.astype( np.int64 ) @ ( 1 << np.arange( _bits.shape[ 2 ] - 1, -1, -1, dtype = np.int64 ) )
+		return np.where( numbers > _maximum, numbers % ( _maximum + 1 ), numbers )
+	
+	# The counterpart of crossTwoGenomes for packed genomes - row i of the result is a combination of row i of _genomes1 and row i of _genomes2
+	def crossGenomesPacked( self, _genomes1, _genomes2 ):
+		n = len( _genomes1 )
+		genome_length = self.genomeLength
+		min_step = max( self.crossMinStep, 1 )
+		
+		# split every genome in steps of random length between crossMinStep and crossMaxStep and pick randomly which genome every step is copied from
+		steps = self.npRandom.integers( min_step, max( self.crossMaxStep, min_step ) + 1, ( n, genome_length // min_step + 1 ) )
+		boundaries = np.minimum( np.cumsum( steps, axis = 1 ), genome_length )
+		marks = np.zeros( ( n, genome_length + 1 ), dtype = np.int32 )
+		marks[ np.arange( n )[ :, None ], boundaries ] = 1
+		step_index = np.cumsum( marks[ :, : genome_length ], axis = 1 ) # which step every bit belongs to
+		from_genome1 = self.npRandom.random( ( n, steps.shape[ 1 ] + 1 ) ) < 0.5
+		mask = np.packbits( np.take_along_axis( from_genome1, step_index, axis = 1 ), axis = 1 )
+		result_genomes = ( _genomes1 & mask ) | ( _genomes2 & ~mask )
+		
+		if self.mutationProbability > 0: # here we also implement the mutation feature
+			mutated = np.flatnonzero( self.npRandom.random( n ) < self.mutationProbability )
+			if len( mutated ) > 0:
+				if type( self.mutationSize ) is float:
+					number_of_mutations = int( round( genome_length * self.mutationSize ) )
+				else:
+					number_of_mutations = int( self.mutationSize )
+				# randomizing a bit is the same as flipping it with a 50/50 chance, so the mutation is an XOR with a mask where each attempted bit is set with a 50/50 chance
+				flips = np.zeros( ( len( mutated ), genome_length ), dtype = bool )
+				positions = self.npRandom.integers( 0, genome_length, ( len( mutated ), number_of_mutations ) )
+				flips[ np.arange( len( mutated ) )[ :, None ], positions ] = self.npRandom.random( positions.shape ) < 0.5
+				result_genomes[ mutated ] ^= np.packbits( flips, axis = 1 )
+		
+		return result_genomes
+	
+	# take two genomes, combine them randomly and return a new one
+	def crossTwoGenomes( self, _genome1, _genome2 ):
+		genome_length = len( _genome1 )
+		index = 0
+		result_genome = "";
+		
+		while True:
+			step = self.random.randint( self.crossMinStep, self.crossMaxStep ) # each time define a new random step between the min and max limit
+			if step > genome_length - ( index + 1 ): # if the step goes beyond the end of the genome, then we only need to take what's left from the genome
+				if self.random.random() < 0.5: # randomly choose which genome to copy data from
+					result_genome += _genome1[ index : ]
+				else:
+					result_genome += _genome2[ index : ]
+				break
+			if self.random.random() < 0.5: # otherwise, the step is short from the end of the genome so take the step and again randomly choose which genome to copy data from
+				result_genome += _genome1[ index : index + step ]
+			else:
+				result_genome += _genome2[ index : index + step ]
+			index += step
+		
+		if self.mutationProbability > 0: # here we also implement the mutation feature
+			if self.random.random() < self.mutationProbability:
+				result_genome = list( result_genome ) # convert the string to a list so we can access and change individual letters
+				
+				if type( self.mutationSize ) is float:
+					number_of_mutations = int( round( len( result_genome ) * self.mutationSize ) ) # if the parameter is float then it represents relative size of the genome and find what number that translates to
+				else:
+					number_of_mutations = int( self.mutationSize ) # else, we take the value, not the reference
+					
+				for p, u in zip( self.random.randints( 0, len( result_genome ) - 1, number_of_mutations ), self.random.randoms( number_of_mutations ) ):
+					result_genome[ p ] = "0" if u < 0.5 else "1" # randomize that many random bits in the genome
+					
+				result_genome = "".join( result_genome ) # and convert back to a single string
+		
+		return result_genome
+	
+	# This function is the opposite of numberToString. It takes a genome as an input and converts it to start times and resource ids
+	def genomeToValues( self, _genome ):
+		start_times = []
+		resources = []
+		segment = self.genomeSegment # A segment contains the number of bits needed to represent one operation - the bits for the highest possible start time plus the bits for the highest possible resource ids.
+		
+		for i in range( self.operationCount ): # The number of segments in a genome is equal to the number of operations.
+			st_from = i * segment # the beginning of the start time string
+			st_to = i * segment + self.genomeStartBits # the end of the start time string
+			r_from = i * segment + self.genomeStartBits # the beginning of the resource id string
+			r_to = ( i + 1 ) * segment # the end of the resource id string
+			
+			start_times.append( self.decodeValue( _genome[ st_from : st_to ], self.operationMaxTime ) )
+			resources.append( self.decodeValue( _genome[ r_from : r_to ], self.resourceCount - 1 ) )
+			
+		return start_times, resources
+		
+	""" Beginning with version 5.00, Tournament is a new mode that accumulates best individuals from each run until a new population is formed, called the Tournament population.
+	The new population then becomes the starting point of a run of the solver and continues indefinitely.
+	The run can be interrupted with Ctrl+C which will prompt for a value:
+		- Providing no value and hiting enter will start a new run with the same Tournament population.
+		- Providing any other value will exit the script. Also, doing Ctrl+C during the prompt will exit the script.
+	"""
+	def tournament( self ):
+		self.seedTournament()
+		
+		while True: # now that we have a Tournament population, we start breeding the population
+			try:
+				self.reset()
+				self.populationSize = self.tournamentPopulationSize
+				self.population.load( self.tournamentPopulation ) # the Tournament population is not consumed, but copied, so can be resued
+				while True: # the breeding will continue indefinitely...
+					self.breedPopulation( do_print=True, print_text="Trnmnt" )
+			except KeyboardInterrupt: # ...until you press Ctrl+C...
+				reply = input( "Press Enter to start a new run with the tournament population..." )
+				if reply != "": # ...and here you have a choice to start again with the same Tournament population or exit the script
+					break
+					
+	# The Tournament mode without any interaction, for batch jobs and benchmarks. The Tournament population is filled (unless it already is) and then bred until one of the limits is reached, see run() for the limits.
+	# With _restarts, the breeding is started again from the Tournament population that many times, unless the _targetScore has been reached.
+	# _maxSeconds is the budget of the whole call: filling the Tournament population counts towards it, every restart only gets the time that is left, and no restart is started once it is used up. The first restart is always done, so it can take up to one generation longer.
+	# Returns a dictionary with a copy of the 'best' member of all restarts, the 'population' of the tournamentSample best members of all restarts, the statistics of every restart in 'runs' (see run) and the total 'seconds'.
+	def runTournament( self, _maxGenerations = None, _maxSeconds = None, _targetScore = None, _stallGenerations = None, _restarts = 0, do_print = False ):
+		start_time = time.time()
+		if len( self.tournamentPopulation ) < self.tournamentPopulationSize:
+			self.seedTournament( do_print, _maxSeconds )
+		runs = []
+		best = []
+		for restart in range( _restarts + 1 ):
+			seconds = None if _maxSeconds is None else max( _maxSeconds - ( time.time() - start_time ), 0 ) # the time left
+			if seconds == 0 and len( runs ) > 0:
+				break
+			self.reset()
+			self.populationSize = self.tournamentPopulationSize
+			self.population.load( self.tournamentPopulation ) # the Tournament population is not consumed, but copied, so can be resued
+			runs.append( self.run( _maxGenerations, seconds, _targetScore, _stallGenerations, do_print = do_print, print_text = "Trnmnt" ) )
+			best.append( runs[ -1 ][ "best" ] ) # the best member found during the run, which may not have survived until its end
+			best.extend( self.getMigrants( self.tournamentSample ) )
+			if do_print: print( "{}\tTournament run {} of {} stopped by {} after {} generations, best: {}".format( dtnow(), restart + 1, _restarts + 1, runs[ -1 ][ "reason" ], runs[ -1 ][ "generations" ], runs[ -1 ][ "best" ][ "score" ] ) )
+			if runs[ -1 ][ "reason" ] == "targetScore":
+				break
+		unique = {}
+		for individual in best: # the same member can be found by several runs or be both the best of a run and its migrant
+			unique.setdefault( fingerprint( individual[ "start_times" ], individual[ "resources" ] ), individual )
+		best = heapq.nlargest( self.tournamentSample, unique.values(), key = lambda individual: individual[ "score" ] )
+		return { "best": best[ 0 ], "population": best, "runs": runs, "seconds": time.time() - start_time }
+	
+	# Fill the Tournament population with the best members of independent runs of the solver
+	# With _maxSeconds, the filling stops when the time is up, even if the Tournament population is not full yet. The run that is going then is cut short, but its best members are still added, so at least one run contributes.
+	def seedTournament( self, do_print = True, _maxSeconds = None ):
+		deadline = None if _maxSeconds is None else time.time() + _maxSeconds
+		if self.tournamentWorkers > 1:
+			return self.seedTournamentParallel( do_print, deadline )
+		keepbreeding = True
+		while keepbreeding: # keep looping until the Tournament population has been filled with individuals; each cycle of the loop is refer to as "run of the solver" or "run of the model"
+			self.reset()
+			self.addRandomToPopulation( self.populationSize ) # every run starts with a random population
+			for g in range( self.tournamentGenerations ): 
+				if deadline is not None and time.time() >= deadline:
+					break
+				self.breedPopulation( do_print, "TrnmPop{}of{}".format( len( self.tournamentPopulation ), self.tournamentPopulationSize ) )
+			for individual in self.getMigrants( self.tournamentSample ): # how many best individuals to take from the current population...
+				self.tournamentPopulation.append( individual ) # ...and add to the Tournament population
+				if len( self.tournamentPopulation ) == self.tournamentPopulationSize:
+					keepbreeding = False # make sure the parent loop will break, too
+					break
+			if deadline is not None and time.time() >= deadline:
+				break
+		return True
+	
+	# The same as seedTournament, but the runs are done by a pool of tournamentWorkers processes. The Tournament population is filled in the order in which the runs finish, and the remaining runs are stopped when it is full or when the _deadline (a time.time() value or None) has passed.
+	def seedTournamentParallel( self, do_print = True, _deadline = None ):
+		runs = -( -( self.tournamentPopulationSize - len( self.tournamentPopulation ) ) // self.tournamentSample ) # round up
+		parameters = dict( self.parameters, scoringWorkers = 0 ) # the runs are already in worker processes
+		tasks = []
+		for run in range( runs ):
+			if self.randomSeed is not None: # every run needs its own seed, otherwise all runs would be the same
+				parameters = dict( parameters, randomSeed = self.randomSeed + run + 1 )
+			tasks.append( ( parameters, self.tournamentGenerations, self.tournamentSample, _deadline ) )
+		with multiprocessing.Pool( self.tournamentWorkers ) as pool: # leaving the block stops the runs that are still going
+			for best in pool.imap_unordered( runTournamentSeed, tasks ):
+				self.tournamentPopulation.extend( best[ : self.tournamentPopulationSize - len( self.tournamentPopulation ) ] )
+				if do_print: print( "{}\tTrnmPop{}of{} best: {}".format( dtnow(), len( self.tournamentPopulation ), self.tournamentPopulationSize, best[ 0 ][ "score" ] ) )
+				if len( self.tournamentPopulation ) >= self.tournamentPopulationSize or ( _deadline is not None and time.time() >= _deadline ):
+					break
+		return True
+	
+	# The best _n members of the population as dictionaries, for example to send them to another population (see Islands)
+	def getMigrants( self, _n ):
+		self.scorePopulation()
+		best = heapq.nlargest( _n, range( len( self.population ) ), key = self.population.score.__getitem__ )
+		return [ self.population.getIndividualAsDict( i ) for i in best ]
+	
+	# Replace the worst members of the population with the given members [list of dictionaries], for example the migrants from another population. The members are scored again by this population, because another population can score them differently (e.g. with other weights)
+	def acceptMigrants( self, _individuals ):
+		if len( _individuals ) == 0:
+			return True
+		self.scorePopulation()
+		population = self.population
+		worst = set( heapq.nsmallest( len( _individuals ), range( len( population ) ), key = population.score.__getitem__ ) )
+		population.reorder( [ i for i in range( len( population ) ) if i not in worst ] )
+		for individual in _individuals:
+			population.append( individual[ "start_times" ], individual[ "resources" ] ) # the new member is dirty, so it is scored with the next scorePopulation()
+			if self.historyKeep == True:
+				self.history.add( fingerprint( individual[ "start_times" ], individual[ "resources" ] ) )
+		return True
+	
+	# The operations of member _i that use the same resource at the same time, as a list of ( op1, op2, overlap ) tuples, e.g. for repairing the member
+	def getResourceConflicts( self, _i = 0 ):
+		return self.resourceConflicts.conflicts( self.population.start_times[ _i ], self.population.resources[ _i ] )
+	
+	# copy member i of source [Population or list of dictionaries] into a new dictionary
+	def getIndividualAsACopy( self, source, i ):
+		return_dict = {}
+		return_dict[ "start_times" ] = list( source[ i ][ "start_times" ] )
+		return_dict[ "resources" ] = list( source[ i ][ "resources" ] )
+		return_dict[ "score" ] = int( source[ i ][ "score" ] )
+		return_dict[ "genome" ] = str( source[ i ][ "genome" ] )
+		return return_dict
+		
+	# A function that prints the current state of the model. 'Normalized' means to shift the whole schedule earlier so it begins at time 0. For example, a start times [ 3, 7, 2, 10 ] is normalized to [ 1, 5, 0, 8 ] because in essence it is the same schedule.
+	# The best member is the first one, unless its index is given in _i
+	def printBestNormalized( self, _text = '', _i = 0 ):
+		min_start_time = min( self.population[ _i ][ "start_times" ] ) # find the lowest start time...
+		start_times = []
+		for i in self.population[ _i ][ "start_times" ]:
+			start_times.append( i - min_start_time ) # ... and subtract it from every start time
+		# then print some information
+		print( "{} avg: {}, score: {}, s_opRel: {}, s_resSucc: {}, s_fastRes: {}".format(
+				_text,
+				round( self.averageScore, 1 ) if self.averageScore else self.averageScore,
+				self.population[ _i ][ "score" ],
+				self.population[ _i ][ "score_operationRelations" ],
+				self.population[ _i ][ "score_resourceSuccession" ],
+				self.population[ _i ][ "score_fastestResource" ],
+				#start_times
+				#self.population[ _i ][ "resources" ]
+			)
+		)
+
+	# prints a random member of the current population
+	def printRandom( self, _text = '' ):
+		i = self.random.randint( 0, len( self.population ) - 1 )
+		print( _text + " avg: {}\tscore: {}\ts_opRel: {}\ts_resSucc: {}\ts_fastRes: {}\tstart_times: {}\tresources: {}".format(
+				self.averageScore,
+				self.population[ i ][ "score" ],
+				self.population[ i ][ "score_operationRelations" ],
+				self.population[ i ][ "score_resourceSuccession" ],
+				self.population[ i ][ "score_fastestResource" ],
+				self.population[ i ][ "start_times" ],
+				self.population[ i ][ "resources" ]
+			)
+		)
+	
+	# print all scores from the current population in descending order
+	def printAllScores( self, _text = '' ):
+		all_scores = self.population.scores()
+		all_scores.sort( reverse = True )
+		print( _text + " " + str( all_scores ) )
+	
+	# This is a function that automates the testing of the model. The same problem definition can be solved using several different combinations of parameters in order to find out which combination works best. Then you can use the best combination to do some more solving and hopefully find an even better solution.
+	# For example, it can help you answer questions such as: Is it better to have many generations with a small population size or rather have fewer generations with a large population size, or does it not matter overall?
+	# The input parameters of automatedTest. Every parameter has a list of values, and every combination of the values is tested. Change these to suit your needs.
+	def automatedTestGrid( self ):
+		return {
+			"filename": "automatedTest_results.txt", # the file which to write the results to, the completed runs are recorded in the same file with '.journal' appended
+			"racingFilename": "automatedTestRacing_results.txt", # the file which automatedTestRacing writes the results to
+			"database": "automatedTest_results.sqlite3", # the results are also stored in this SQLite database (see ResultsStore), which can print the impact analysis with ResultsStore( database ).report() [None for not using it]
+			"batchSize": 20, # the number of finished runs that are written to the files and the database at once
+			"generations": [ 50, 150, 300 ], # the number of generations (or cycles) in each run, i.e. how many times the population will breed and create new solutions
+			"runs": [ 5 ], # the number of runs to carry out for each combination of parameters; remember that on each new run the population is totally randomizd initially
+			"crossMinStep": [ 0.05, 0.15, 0.35 ],
+			"crossMaxStep": [ 0.1, 0.3, 0.5 ],
+			"populationSize": [ 50, 200, 600 ],
+			"survivalRate": [ 0.05, 0.15, 0.5 ],
+			"mutationProbability": [ 0, 0.05, 0.15, 0.5 ],
+			"mutationSize": [ 0.05, 0.15, 0.25 ],
+			"infuseRandomToPopulation": [ 0, 5, 15, 30 ]
+		}
+	
+	# The combinations of the grid, in the order in which automatedTest has always numbered them. Returns the number of combinations in the grid and a list of ( combination #, parameters ) for the combinations that are valid, i.e. where Cross Min Step is not greater than Cross Max Step.
+	def automatedTestCombinations( self, _grid ):
+		number_of_combinations = 1
+		for name in ( "generations", "crossMinStep", "crossMaxStep", "populationSize", "survivalRate", "mutationProbability", "mutationSize", "infuseRandomToPopulation" ):
+			number_of_combinations *= len( _grid[ name ] )
+		combinations = []
+		current_combination = 0
+		for cross_min in _grid[ "crossMinStep" ]:
+			for cross_max in _grid[ "crossMaxStep" ]:
+				if cross_min > cross_max:
+					# if Cross Min Step is greater than Cross Max Step then skip all these combinations, but keep their numbers
+					current_combination += number_of_combinations // ( len( _grid[ "crossMinStep" ] ) * len( _grid[ "crossMaxStep" ] ) )
+					continue
+				for pop_size in _grid[ "populationSize" ]:
+					for sur_rate in _grid[ "survivalRate" ]:
+						for mut_prob in _grid[ "mutationProbability" ]:
+							for mut_size in _grid[ "mutationSize" ]:
+								for inf_rand in _grid[ "infuseRandomToPopulation" ]:
+									for gen in _grid[ "generations" ]:
+										current_combination += 1
+										combinations.append( ( current_combination, {
+											"generations": gen,
+											"crossMinStep": cross_min,
+											"crossMaxStep": cross_max,
+											"populationSize": pop_size,
+											"survivalRate": sur_rate,
+											"mutationProbability": mut_prob,
+											"mutationSize": mut_size,
+											"infuseRandomToPopulation": inf_rand
+										} ) )
+		return number_of_combinations, combinations
+	
+	# The column headers of the automatedTest results
+	automatedTestColumns = (
+		"Combination #",
+		"Run #",
+		"Time",
+		
+		"Best Score",
+		"Average Score",
+		"Worst Score",
+		
+		"Operation Relations score - Best",
+		"Operation Relations score - Average",
+		"Operation Relations score - Worst",
+		
+		"Resource Succession score - Best",
+		"Resource Succession score - Average",
+		"Resource Succession score - Worst",
+		
+		"Fastest Resource score - Best",
+		"Fastest Resource score - Average",
+		"Fastest Resource score - Worst",
+		
+		"Generations",
+		"Cross Min Step",
+		"Cross Max Step",
+		"Population Size",
+		"Survival Rate",
+		"Mutation Probability",
+		"Mutation Size",
+		"Infuse Random",
+		
+		"Best Solution Start Times",
+		"Best Solution Resource IDs"
+	)
+	
+	# The values of one line of the automatedTest results, for the run that has just finished. The population has to be scored and sorted.
+	def automatedTestRow( self, _combination, _run, _seconds, _values ):
+		score_operationRelations = tuple( self.population.score_operationRelations[ : len( self.population ) ] )
+		score_resourceSuccession = tuple( self.population.score_resourceSuccession[ : len( self.population ) ] )
+		score_fastestResource = tuple( self.population.score_fastestResource[ : len( self.population ) ] )
+		return [
+			_combination,
+			_run,
+			round( _seconds, 2 ),
+			
+			self.population[ 0 ][ "score" ],
+			self.averageScore,
+			self.population[ -1 ][ "score" ],
+			
+			max( score_operationRelations ),
+			sum( score_operationRelations ) / len( score_operationRelations ),
+			min( score_operationRelations ),
+			
+			max( score_resourceSuccession ),
+			sum( score_resourceSuccession ) / len( score_resourceSuccession ),
+			min( score_resourceSuccession ),
+			
+			max( score_fastestResource ),
+			sum( score_fastestResource ) / len( score_fastestResource ),
+			min( score_fastestResource ),
+			
+			_values[ "generations" ],
+			_values[ "crossMinStep" ],
+			_values[ "crossMaxStep" ],
+			_values[ "populationSize" ],
+			_values[ "survivalRate" ],
+			_values[ "mutationProbability" ],
+			_values[ "mutationSize" ],
+			_values[ "infuseRandomToPopulation" ],
+			
+			self.population[ 0 ][ "start_times" ],
+			self.population[ 0 ][ "resources" ]
+		]
+	
+	# Run every combination of the parameters from automatedTestGrid a number of times and write the results to a tab-separated file, one line per run.
+	# Every run is a job for a pool of _workers processes [0 for running the jobs one after another in this process, else 2 <= integer < inf]. The runs of a sweep are independent, so the lines are written in the order in which the runs finish.
+	# Every finished run is recorded in a journal next to the results. If the sweep is interrupted, calling automatedTest again continues with the runs that are not in the journal. Delete the journal to start a new sweep.
+	def automatedTest( self, _workers = 0 ):
+		grid = self.automatedTestGrid()
+		filename = grid[ "filename" ]
+		number_of_combinations, combinations = self.automatedTestCombinations( grid )
+		
+		tasks = []
+		for combination, values in combinations:
+			job = 0
+			for runs in grid[ "runs" ]:
+				for r in range( runs ):
+					seed = None if self.randomSeed is None else self.randomSeed + len( tasks ) # every run has its own seed, which doesn't depend on the order of the runs
+					tasks.append( ( self.parameters, combination, job, r + 1, values, seed ) )
+					job += 1
+		
+		done = set() # the ( combination #, job # ) of the runs that are finished
+		try:
+			with open( filename + ".journal", "rt", encoding = "utf-8" ) as f:
+				for line in f:
+					if line.strip() != "":
+						done.add( tuple( int( x ) for x in line.split( "\t" ) ) )
+		except FileNotFoundError:
+			pass
+		remaining = [ task for task in tasks if ( task[ 1 ], task[ 2 ] ) not in done ]
+		print( "{}\t{} combinations, {} of them are valid, {} runs in total, {} runs to do".format( dtnow(), number_of_combinations, len( combinations ), len( tasks ), len( remaining ) ) )
+		
+		line_template = "{}\t" * 25 + "\n"
+		store = ResultsStore( grid[ "database" ] ) if grid[ "database" ] is not None else None
+		pool = multiprocessing.Pool( _workers ) if _workers > 1 else None
+		pending = [] # the finished runs that are not written yet
+		try:
+			with open( filename, "at", encoding = "utf-8" ) as f, open( filename + ".journal", "at", encoding = "utf-8" ) as journal:
+				if len( done ) == 0: # a new sweep
+					f.write( line_template.format( *self.automatedTestColumns ) )
+				try:
+					results = pool.imap_unordered( runAutomatedTestJob, remaining ) if pool is not None else map( runAutomatedTestJob, remaining )
+					for finished, ( combination, job, row ) in enumerate( results ):
+						pending.append( ( combination, job, row ) )
+						print( "{}\tFinished combination {} of {}, run number {}, {} of {} runs to do".format( dtnow(), combination, number_of_combinations, row[ 1 ], finished + 1, len( remaining ) ) )
+						if len( pending ) >= grid[ "batchSize" ]:
+							self.writeAutomatedTestResults( pending, f, journal, store )
+				finally: # whatever has finished is written, even if the sweep is interrupted
+					self.writeAutomatedTestResults( pending, f, journal, store )
+		finally:
+			if pool is not None:
+				pool.terminate()
+				pool.join()
+			if store is not None:
+				store.close()
+		return True
+	
+	# Write the finished runs in _results [list of ( combination #, job #, values of the line )] to the results file, the database (unless _store is None) and the journal, and empty the list.
+	# The runs are recorded in the journal last, so a run in the journal is never missing from the results.
+	def writeAutomatedTestResults( self, _results, _file, _journal, _store ):
+		if len( _results ) == 0:
+			return True
+		line_template = "{}\t" * 25 + "\n"
+		_file.write( "".join( line_template.format( *row ) for combination, job, row in _results ) )
+		_file.flush()
+		if _store is not None:
+			_store.add( [ row for combination, job, row in _results ], "automatedTest" )
+			_store.flush()
+		_journal.write( "".join( "{}\t{}\n".format( combination, job ) for combination, job, row in _results ) )
+		_journal.flush()
+		del _results[ : ]
+		return True
+	
+	# An adaptive version of automatedTest (successive halving). Instead of running every combination for every number of generations, all parameter sets of the grid are first run for the smallest number of generations,
+	# then only the best 1 / _eta of them (by the average best score of their runs) are run again with _eta times more generations, and so on until the largest number of generations in the grid is reached or one parameter set is left.
+	# Hopeless parameter sets are dropped after a short run, so most of the time is spent on the promising ones. The results are written with the same columns as automatedTest to the 'racingFilename' of the grid, every line is one run of one round.
+	# The 'Combination #' of a parameter set is the one it has in automatedTest with the smallest number of generations. Returns the parameter sets of the last round, best first, as a list of ( average best score, combination #, parameters ).
+	def automatedTestRacing( self, _workers = 0, _eta = 3 ):
+		grid = self.automatedTestGrid()
+		number_of_combinations, combinations = self.automatedTestCombinations( grid )
+		min_generations = min( grid[ "generations" ] )
+		max_generations = max( grid[ "generations" ] )
+		candidates = [ ( combination, { name: values[ name ] for name in values if name != "generations" } ) for combination, values in combinations if values[ "generations" ] == min_generations ] # one candidate per parameter set, the number of generations is the budget
+		
+		line_template = "{}\t" * 25 + "\n"
+		store = ResultsStore( grid[ "database" ] ) if grid[ "database" ] is not None else None
+		pool = multiprocessing.Pool( _workers ) if _workers > 1 else None
+		seed = self.randomSeed
+		generations = min_generations
+		try:
+			with open( grid[ "racingFilename" ], "at", encoding = "utf-8" ) as f:
+				f.write( line_template.format( *self.automatedTestColumns ) )
+				while True:
+					print( "{}\tRacing {} parameter sets for {} generations".format( dtnow(), len( candidates ), generations ) )
+					tasks = []
+					for combination, values in candidates:
+						for runs in grid[ "runs" ]:
+							for r in range( runs ):
+								tasks.append( ( self.parameters, combination, len( tasks ), r + 1, dict( values, generations = generations ), None if seed is None else seed + len( tasks ) ) )
+					if seed is not None:
+						seed += len( tasks ) # the next round gets new seeds
+					scores = {} # the best scores of the runs of every candidate
+					results = pool.imap_unordered( runAutomatedTestJob, tasks ) if pool is not None else map( runAutomatedTestJob, tasks )
+					rows = []
+					for combination, job, row in results:
+						f.write( line_template.format( *row ) )
+						scores.setdefault( combination, [] ).append( row[ 3 ] )
+						rows.append( row )
+					f.flush()
+					if store is not None:
+						store.add( rows, "automatedTestRacing" )
+						store.flush()
+					
+					ranking = sorted( ( ( sum( scores[ combination ] ) / len( scores[ combination ] ), combination, values ) for combination, values in candidates ), key = lambda entry: entry[ 0 ], reverse = True )
+					print( "{}\tBest average score {} by combination {}: {}".format( dtnow(), round( ranking[ 0 ][ 0 ], 1 ), ranking[ 0 ][ 1 ], ranking[ 0 ][ 2 ] ) )
+					if generations >= max_generations or len( ranking ) == 1:
+						return ranking
+					candidates = [ ( combination, values ) for score, combination, values in ranking[ : max( len( ranking ) // _eta, 1 ) ] ]
+					generations = min( generations * _eta, max_generations )
+		finally:
+			if pool is not None:
+				pool.terminate()
+				pool.join()
+			if store is not None:
+				store.close()
+
+
+# One run of automatedTest, _task is a tuple of ( parameters, combination #, job #, run #, values of the combination, random seed ). Returns ( combination #, job #, the values of the line of the results ).
+def runAutomatedTestJob( _task ):
+	parameters, combination, job, run, values, seed = _task
+	parameters = dict( parameters, scoringWorkers = 0, randomSeed = seed )
+	for name in values:
+		if name != "generations":
+			parameters[ name ] = values[ name ]
+	solver = GAS( parameters )
+	solver.addRandomToPopulation( solver.populationSize )
+	
+	time_start = time.time()
+	for g in range( values[ "generations" ] ):
+		solver.breedPopulation()
+	time_end = time.time()
+	
+	solver.scorePopulation()
+	solver.population.sortByScore()
+	row = solver.automatedTestRow( combination, run, time_end - time_start, values )
+	solver.close()
+	return combination, job, row
+
+
+class ResultsStore():
+	""" The results of automatedTest and automatedTestRacing in an SQLite database, one row per run with the same columns as the tab-separated results, plus the name of the 'sweep' that produced it.
+	The parameter columns are indexed, so the results can be queried with any SQL tool. Rows are added in batches with add() and written with flush().
+	report() calculates the summary and the impact analysis that used to be done by hand from the tab-separated results."""
+	
+	# the names of the database columns, in the order of GAS.automatedTestColumns
+	columns = ( "combination", "run", "time", "best_score", "average_score", "worst_score",
+		"operation_relations_best", "operation_relations_average", "operation_relations_worst",
+		"resource_succession_best", "resource_succession_average", "resource_succession_worst",
+		"fastest_resource_best", "fastest_resource_average", "fastest_resource_worst",
+		"generations", "cross_min_step", "cross_max_step", "population_size", "survival_rate", "mutation_probability", "mutation_size", "infuse_random",
+		"best_start_times", "best_resources" )
+	parameters = ( ( "generations", "Generations" ), ( "cross_min_step", "Cross Min Step" ), ( "cross_max_step", "Cross Max Step" ), ( "population_size", "Population Size" ),
+		( "survival_rate", "Survival Rate" ), ( "mutation_probability", "Mutation Probability" ), ( "mutation_size", "Mutation Size" ), ( "infuse_random", "Infuse Random" ) ) # the indexed columns and their names in the report
+	
+	def __init__( self, _filename ):
+		self.filename = str( _filename )
+		self.connection = sqlite3.connect( self.filename )
+		self.pending = [] # the rows that are added but not written yet
+		self.connection.execute( "CREATE TABLE IF NOT EXISTS runs ( sweep TEXT, {} )".format( ", ".join( self.columns ) ) )
+		for column, name in self.parameters:
+			self.connection.execute( "CREATE INDEX IF NOT EXISTS runs_{0} ON runs ( {0} )".format( column ) )
+		self.connection.commit()
+	
+	# add the values of result lines [list of lists, see GAS.automatedTestRow] produced by _sweep [string]
+	def add( self, _rows, _sweep = "automatedTest" ):
+		for row in _rows:
+			self.pending.append( [ _sweep ] + [ str( value ) if type( value ) is list else value for value in row ] )
+		return True
+	
+	# write all added rows in one transaction
+	def flush( self ):
+		if len( self.pending ) > 0:
+			with self.connection:
+				self.connection.executemany( "INSERT INTO runs VALUES ( {} )".format( ", ".join( [ "?" ] * ( len( self.columns ) + 1 ) ) ), self.pending )
+			self.pending = []
+		return True
+	
+	def close( self ):
+		self.flush()
+		self.connection.close()
+		return True
+	
+	# add the results of an existing tab-separated results file, e.g. from a sweep done with an older version
+	def importResults( self, _filename, _sweep = "automatedTest" ):
+		rows = []
+		with open( _filename, "rt", encoding = "utf-8" ) as f:
+			for line in f:
+				values = line.rstrip( "\n" ).split( "\t" )[ : len( self.columns ) ]
+				if len( values ) < len( self.columns ) or values[ 0 ] == GAS.automatedTestColumns[ 0 ]: # a header line, or not a result
+					continue
+				rows.append( [ None if value == "None" else value if i >= len( self.columns ) - 2 else float( value ) for i, value in enumerate( values ) ] )
+		self.add( rows, _sweep )
+		return self.flush()
+	
+	# The summary of the runs of _sweep as text. The default is the full grid of automatedTest, because the runs of automatedTestRacing are cut short and would skew the statistics; 'automatedTestRacing' gives the racing runs and None gives all runs.
+	# - the best, average and worst run time and scores
+	# - how often the best score of a run reached each of the _thresholds [list of numbers], and the run times of those runs. If no thresholds are given, the best score found and the scores reached by 1%, 5% and 25% of the runs are used.
+	# - the impact analysis, i.e. the average run time and best score for every value of every parameter
+	def report( self, _thresholds = None, _sweep = "automatedTest" ):
+		self.flush()
+		where = "" if _sweep is None else " WHERE sweep = ?"
+		arguments = () if _sweep is None else ( _sweep, )
+		query = lambda sql: self.connection.execute( sql.format( where = where ), arguments ).fetchall()
+		runs, = query( "SELECT COUNT(*) FROM runs{where}" )[ 0 ]
+		if runs == 0:
+			return "No results"
+		lines = [ "Some statistics and summary:", "", "\t\t\t\t\t\tBest\tAverage\t\tWorst" ]
+		for name, column, best, worst in ( ( "Runtime\t\t\t\t", "time", "MIN", "MAX" ), ( "Best Score for run\t", "best_score", "MAX", "MIN" ), ( "Average Score for run", "average_score", "MAX", "MIN" ), ( "Worst Score for run\t", "worst_score", "MAX", "MIN" ) ):
+			values = query( "SELECT {0}({2}), AVG({2}), {1}({2}) FROM runs{{where}}".format( best, worst, column ) )[ 0 ]
+			lines.append( "{}\t{}\t\t{}\t\t{}".format( name, *( round( value, 2 ) if value is not None else value for value in values ) ) )
+		lines.append( "" )
+		
+		if _thresholds is None:
+			scores = [ score for score, in query( "SELECT best_score FROM runs{where} ORDER BY best_score DESC" ) ]
+			_thresholds = sorted( set( [ scores[ 0 ] ] + [ scores[ int( len( scores ) * share ) ] for share in ( 0.01, 0.05, 0.25 ) ] ), reverse = True )
+		for threshold in _thresholds:
+			count, best, average, worst = self.connection.execute( "SELECT COUNT(*), MIN(time), AVG(time), MAX(time) FROM runs WHERE best_score >= ?" + where.replace( "WHERE", "AND" ), ( threshold, ) + arguments ).fetchone()
+			lines.append( "- Solutions with score >= {} were reached {} times, which is {:.4f} % success rate. Run times are (best/average/worst): {} / {} / {}".format(
+				threshold, count, 100.0 * count / runs, *( round( value, 2 ) if value is not None else "-" for value in ( best, average, worst ) ) ) )
+		lines += [ "", "", "Impact Analysis", "" ]
+		
+		for column, name in self.parameters:
+			rows = query( "SELECT {0}, AVG(time), AVG(best_score) FROM runs{{where}} GROUP BY {0} ORDER BY {0}".format( column ) )
+			lines.append( "\t- {}\t\t{}".format( name, "\t\t".join( str( value ) for value, time, score in rows ) ) )
+			lines.append( "\t\tAvg Time\t\t\t\t{}".format( "\t".join( "{:.2f}".format( time ) for value, time, score in rows ) ) )
+			lines.append( "\t\tAvg Best Score for run\t{}".format( "\t".join( str( int( round( score ) ) ) for value, time, score in rows ) ) )
+			lines.append( "" )
+		return "\n".join( lines )
+	
+	
+# One run of the solver for GAS.seedTournamentParallel, _task is a tuple of ( parameters, generations, sample, deadline ). Returns the best 'sample' members.
+def runTournamentSeed( _task ):
+	parameters, generations, sample, deadline = _task
+	solver = GAS( parameters )
+	solver.addRandomToPopulation( solver.populationSize )
+	for generation in range( generations ):
+		if deadline is not None and time.time() >= deadline: # the run is cut short, see seedTournament
+			break
+		solver.breedPopulation()
+	best = solver.getMigrants( sample )
+	solver.close()
+	return best
+
+
+# An island is a GAS instance in its own process. It waits for commands from the Islands driver on _connection:
+# ( 'evolve', generations, migrants, count ) - accept the migrants, breed the given number of generations and reply with the best 'count' members and the average score
+# ( 'stop', ) - stop the process
+def runIsland( _connection, _parameters ):
+	island = GAS( _parameters )
+	island.addRandomToPopulation( island.populationSize )
+	while True:
+		command = _connection.recv()
+		if command[ 0 ] != "evolve":
+			break
+		island.acceptMigrants( command[ 2 ] )
+		for generation in range( command[ 1 ] ):
+			island.breedPopulation()
+		_connection.send( ( island.getMigrants( command[ 3 ] ), island.averageScore ) )
+	island.close()
+	_connection.close()
+
+
+class Islands():
+	""" The island model - several populations (islands) of the same problem evolve in parallel, each in its own process, and every 'migrationInterval' generations the best 'migrationSize' members of every island migrate to other islands, where they replace the worst members.
+	The islands keep their own diversity, but good traits still spread between them. Where the migrants go is given by the 'migrationTopology':
+	'ring' - island i sends its migrants to island i + 1, and the last island to the first one
+	'full' - every island sends its migrants to all other islands
+	Every island can have its own parameters: '_parameters' is either one dictionary for all islands or a list of dictionaries, one per island. When all islands share the same randomSeed (also when it is given in every dictionary of the list), island i gets randomSeed + i, so that they don't evolve the same way. Different seeds are kept as they are. The islands are already processes, so scoringWorkers is always 0 on them.
+	Every island scores its members, also the migrants it accepts, with its own parameters. The best member and the island scores are compared by these scores, so they are only meaningful when all islands score the same way (the same weights, asapAlapMode and resourceConflictMode)."""
+	
+	topologies = ( "ring", "full" )
+	
+	def __init__( self, _parameters, _islandCount = 4, _migrationInterval = 10, _migrationSize = 2, _migrationTopology = "ring" ):
+		if type( _parameters ) is dict:
+			self.parameters = [ dict( _parameters ) for i in range( int( _islandCount ) ) ]
+		else:
+			self.parameters = [ dict( p ) for p in _parameters ]
+		self.parameters = [ dict( p, scoringWorkers = 0 ) for p in self.parameters ] # the islands are already processes, and daemonic processes can't start a scoring pool
+		seeds = set( p.get( "randomSeed", None ) for p in self.parameters )
+		if len( self.parameters ) > 1 and len( seeds ) == 1 and None not in seeds: # all islands share the same seed
+			for i in range( len( self.parameters ) ):
+				self.parameters[ i ][ "randomSeed" ] += i
+		self.islandCount = len( self.parameters ) # The number of islands, each one is a process [1 <= integer < inf]
+		self.migrationInterval = int( _migrationInterval ) # The number of generations between two migrations [1 <= integer < inf]
+		self.migrationSize = int( _migrationSize ) # The number of best members that every island sends [0 <= integer < inf]
+		self.migrationTopology = str( _migrationTopology ) # Where the migrants go ['ring' or 'full']
+		if self.migrationTopology not in self.topologies:
+			raise ValueError( "Invalid migrationTopology: {}".format( self.migrationTopology ) )
+		self.processes = [] # [list of multiprocessing.Process]
+		self.connections = [] # [list of multiprocessing.Connection], one per island
+		self.generation = 0 # The number of generations bred on every island so far
+		self.best = None # The best member found on any island [dictionary or None], its score is only comparable between islands that score the same way (the same weights, asapAlapMode and resourceConflictMode)
+		self.bestIsland = None # The island where the best member was found
+		self.islandScores = [ None ] * self.islandCount # The score of the best member of every island after the last migration
+		self.islandAverageScores = [ None ] * self.islandCount # The averageScore of every island after the last migration
+		self.migrants = [ [] for i in range( self.islandCount ) ] # The migrants that every island accepts before it breeds the next generation
+	
+	# start the island processes, this is done by run() if needed
+	def start( self ):
+		for parameters in self.parameters:
+			connection, island_connection = multiprocessing.Pipe()
+			process = multiprocessing.Process( target = runIsland, args = ( island_connection, parameters ), daemon = True )
+			process.start()
+			self.processes.append( process )
+			self.connections.append( connection )
+		return True
+	
+	# Breed _generations generations on every island, with a migration every migrationInterval generations. Can be called again to continue. Returns the best member found so far.
+	def run( self, _generations, do_print = False ):
+		if len( self.processes ) == 0:
+			self.start()
+		remaining = int( _generations )
+		while remaining > 0:
+			generations = min( self.migrationInterval, remaining )
+			for connection, incoming in zip( self.connections, self.migrants ):
+				connection.send( ( "evolve", generations, incoming, max( self.migrationSize, 1 ) ) ) # at least the best member is always needed
+			outgoing = []
+			for i, connection in enumerate( self.connections ): # all islands breed at the same time, here we just wait for each of them
+				best, self.islandAverageScores[ i ] = connection.recv()
+				self.islandScores[ i ] = best[ 0 ][ "score" ]
+				if self.best is None or best[ 0 ][ "score" ] > self.best[ "score" ]:
+					self.best = best[ 0 ]
+					self.bestIsland = i
+				outgoing.append( best[ : self.migrationSize ] )
+			self.migrants = self.migrate( outgoing ) # the migrants are accepted at the start of the next interval, or of the next run
+			remaining -= generations
+			self.generation += generations
+			if do_print: print( "{}\tgeneration: {}, best: {} (island {}), islands: {}".format( dtnow(), self.generation, self.best[ "score" ], self.bestIsland, self.islandScores ) )
+		return self.best
+	
+	# For the migrants sent by every island [list of lists of dictionaries], return the migrants that every island receives
+	def migrate( self, _outgoing ):
+		incoming = [ [] for i in range( self.islandCount ) ]
+		for i, migrants in enumerate( _outgoing ):
+			if self.migrationTopology == "ring":
+				targets = [ ( i + 1 ) % self.islandCount ] if self.islandCount > 1 else []
+			else:
+				targets = [ j for j in range( self.islandCount ) if j != i ]
+			for j in targets:
+				incoming[ j ].extend( migrants )
+		return incoming
+	
+	# stop the island processes
+	def close( self ):
+		for connection in self.connections:
+			try:
+				connection.send( ( "stop", ) )
+			except OSError: # the island has already exited (BrokenPipeError is an OSError)
+				pass
+			connection.close()
+		for process in self.processes:
+			process.join()
+		self.processes = []
+		self.connections = []
+		return True
+	
+
+
+# ideal solution
+# start_times = [ 0, 4, 8, 12, 16 ]
+# resources = [ 0, 1, 0, 1, 0 ]
+operation_durations_simple_1 = {
+	0: [ 4, 10 ],
+	1: [ 10, 4 ],
+	2: [ 4, 10 ],
+	3: [ 10, 4 ],
+	4: [ 4, 10 ]
+}
+operation_relations_simple_1 = {
+	1: {
+		0: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	2: {
+		1: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	3: {
+		2: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	4: {
+		3: { "type":"ES", "min":0, "max":0, "weight":1 }
+	}
+}
+
+
+
+# ideal solution?
+# start_times = [ 5, 6, 17, 0, 14 ]
+# resources = [ 0, 1, 0, 1, 1 ]
+operation_durations_simple_2 = {
+	0: [ 7, 5 ],
+	1: [ 7, 5 ],
+	2: [ 7, 5 ],
+	3: [ 7, 5 ],
+	4: [ 7, 5 ]
+}
+operation_relations_simple_2 = {
+	0: {
+		3: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	4: {
+		0: { "type":"ES", "min":2, "max":2, "weight":1 },
+		1: { "type":"EE", "min":8, "max":8, "weight":1 }
+	},
+	2: {
+		1: { "type":"SS", "min":11, "max":11, "weight":1 }
+	}
+}
+
+
+
+# ideal solution
+# start_times = [ 0, 4, 4, 8, 12, 16, 20, 20, 24, 28, 32, 32, 36, 40, 44, 48, 52, 52, 56, 60 ]
+# resources = [ 0, 1, 2, 0, 2, 1, 0, 2, 1, 2, 0, 1, 2, 0, 2, 1, 0, 2, 1, 0 ]
+operation_durations_complex_1 = {
+	0: [ 4, 10, 10 ],
+	1: [ 10, 4, 10 ],
+	2: [ 10, 10, 4 ],
+	3: [ 4, 10, 10 ],
+	4: [ 10, 10, 4 ],
+	5: [ 10, 4, 10 ],
+	6: [ 4, 10, 10 ],
+	7: [ 10, 10, 4 ],
+	8: [ 10, 4, 10 ],
+	9: [ 10, 10, 4 ],
+	10: [ 4, 10, 10 ],
+	11: [ 10, 4, 10 ],
+	12: [ 10, 10, 4 ],
+	13: [ 4, 10, 10 ],
+	14: [ 10, 10, 4 ],
+	15: [ 10, 4, 10 ],
+	16: [ 4, 10, 10 ],
+	17: [ 10, 10, 4 ],
+	18: [ 10, 4, 10 ],
+	19: [ 4, 10, 10 ],
+}
+operation_relations_complex_1 = {
+	1: {
+		0: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	2: {
+		0: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	3: {
+		1: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	3: {
+		2: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	4: {
+		3: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	5: {
+		4: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	6: {
+		5: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	7: {
+		5: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	8: {
+		6: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	8: {
+		7: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	9: {
+		8: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	10: {
+		9: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	11: {
+		9: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	12: {
+		10: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	12: {
+		11: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	13: {
+		12: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	14: {
+		13: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	15: {
+		14: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	16: {
+		15: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	17: {
+		15: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	18: {
+		16: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	18: {
+		17: { "type":"ES", "min":0, "max":0, "weight":1 }
+	},
+	19: {
+		18: { "type":"ES", "min":0, "max":0, "weight":1 }
+	}
+}
+
+
+
+# ideal solution
+# start_times = [ 24, 35, 34, 32, 22, 13, 24, 3, 7, 10, 0 ]
+# resources = [ 1, 2, 0, 1, 2, 0, 0, 1, 2, 1, 0 ]
+operation_durations_complex_2 = {
+	0: [ 7, 6, 7 ],
+	1: [ 12, 12, 8 ],
+	2: [ 5, 8, 6 ],
+	3: [ 7, 3, 5 ],
+	4: [ 13, 8, 5 ],
+	5: [ 7, 9, 10 ],
+	6: [ 6, 10, 10 ],
+	7: [ 7, 4, 6 ],
+	8: [ 14, 10, 8 ],
+	9: [ 7, 5, 6 ],
+	10: [ 10, 12, 14 ]
+}
+operation_relations_complex_2 = {
+	7: {
+		10: { "type":"ES", "min":-7, "max":-7, "weight":1 }
+	},
+	9: {
+		7: { "type":"ES", "min":3, "max":3, "weight":1 },
+		10: { "type":"EE", "min":5, "max":5, "weight":1 }
+	},
+	8: {
+		9: { "type":"SS", "min":-3, "max":-3, "weight":1 }
+	},
+	6: {
+		8: { "type":"EE", "min":15, "max":15, "weight":1 }
+	},
+	5: {
+		6: { "type":"SE", "min":-4, "max":-4, "weight":1 }
+	},
+	4: {
+		5: { "type":"SS", "min":9, "max":9, "weight":1 }
+	},
+	0: {
+		4: { "type":"EE", "min":3, "max":3, "weight":1 }
+	},
+	2: {
+		0: { "type":"SE", "min":15, "max":15, "weight":1 }
+	},
+	3: {
+		2: { "type":"EE", "min":-4, "max":-4, "weight":1 }
+	},
+	1: {
+		3: { "type":"SS", "min":3, "max":3, "weight":1 }
+	}
+}
+
+
+
+parameters_simple_1 = {
+	"resourceCount": 2,
+	"populationSize": 100,
+	"survivalRate": 0.2,
+	"infuseRandomToPopulation": 0,
+	"crossMinStep": 0.1,
+	"crossMaxStep": 0.18,
+	"mutationProbability": 0.1,
+	"mutationSize": 0.1,
+	"asapAlapMode": "normal",
+	"weightResourceSuccession": 5,
+	"historyKeep": False,
+	"historyRetryCount": 0,
+	"averageScoreSampleSize": 10,
+	"operationDurations": operation_durations_simple_1,
+	"operationRelations": operation_relations_simple_1
+}
+
+parameters_simple_2 = {
+	"resourceCount": 2,
+	"populationSize": 100,
+	"survivalRate": 0.2,
+	"infuseRandomToPopulation": 0,
+	"crossMinStep": 0.1,
+	"crossMaxStep": 0.18,
+	"mutationProbability": 0.1,
+	"mutationSize": 0.1,
+	"asapAlapMode": "normal",
+	"weightResourceSuccession": 5,
+	"historyKeep": False,
+	"historyRetryCount": 0,
+	"averageScoreSampleSize": 10,
+	"operationDurations": operation_durations_simple_2,
+	"operationRelations": operation_relations_simple_2
+}
+
+parameters_complex_1 = {
+	"resourceCount": 3,
+	"populationSize": 300,
+	"survivalRate": 0.15,
+	"infuseRandomToPopulation": 0,
+	"crossMinStep": 0.1,
+	"crossMaxStep": 0.15,
+	"mutationProbability": 0.1,
+	"mutationSize": 0.05,
+	"asapAlapMode": "normal",
+	"weightResourceSuccession": 5,
+	"historyKeep": False,
+	"historyRetryCount": 0,
+	"averageScoreSampleSize": 70,
+	"operationDurations": operation_durations_complex_1,
+	"operationRelations": operation_relations_complex_1
+}
+
+parameters_complex_2 = {
+	"resourceCount": 3,
+	"populationSize": 300,
+	"survivalRate": 0.15,
+	"infuseRandomToPopulation": 0,
+	"crossMinStep": 0.1,
+	"crossMaxStep": 0.15,
+	"mutationProbability": 0.1,
+	"mutationSize": 0.05,
+	"asapAlapMode": "normal",
+	"weightResourceSuccession": 5,
+	"historyKeep": False,
+	"historyRetryCount": 0,
+	"averageScoreSampleSize": 70,
+	"operationDurations": operation_durations_complex_2,
+	"operationRelations": operation_relations_complex_2
+}
+
+
+
+parameters_testing = {
+	"resourceCount": 3,
+	"populationSize": 600,
+	"survivalRate": 0.18,
+	"infuseRandomToPopulation": 1,
+	"crossMinStep": 0.1,
+	"crossMaxStep": 0.4,
+	"mutationProbability": 0.1,
+	"mutationSize": 0.12,
+	"asapAlapMode": "normal",
+	"weightResourceSuccession": 5,
+	"historyKeep": False,
+	"historyRetryCount": 0,
+	"averageScoreSampleSize": 70,
+	"tournamentPopulationSize": 100,
+	"tournamentSample": 10,
+	"tournamentGenerations": 70,
+	"operationDurations": operation_durations_complex_1,
+	"operationRelations": operation_relations_complex_1
+}
+
+
+
+# The examples only run when the file is run as a script, not when worker processes are started from it (scoringWorkers)
+if __name__ == "__main__":
+	# in order to test in real time, do something like (the run stops after 999 generations, or earlier if the best score doesn't improve for 300 generations):
+	GAS_testing = GAS( parameters_testing )
+	GAS_testing.addRandomToPopulation( GAS_testing.populationSize )
+	results = GAS_testing.run( _maxGenerations = 999, _stallGenerations = 300, do_print=True )
+	print( "{}\tStopped by {} after {} generations, best score: {}".format( dtnow(), results[ "reason" ], results[ "generations" ], results[ "best" ][ "score" ] ) )
+	
+	# in order to score the schedules outside of the solver, e.g. with a simulator, do something like:
+	#for generation in range( 100 ):
+	#	candidates = GAS_testing.ask()
+	#	GAS_testing.tell( candidates, [ simulate( c[ "start_times" ], c[ "resources" ] ) for c in candidates ] )
+	
+	# in order to test in Tournament mode:
+	#GAS_testing = GAS( parameters_testing )
+	#GAS_testing.tournament()
+	# or without any interaction, with limits:
+	#results = GAS_testing.runTournament( _maxSeconds = 600, _targetScore = -70, _stallGenerations = 200, _restarts = 3, do_print=True )
+	pass
+	
+	# in order to do automated tests, do something like (the number is the number of worker processes, leave it out to run in this process):
+	#GAS_complex_1 = GAS( parameters_complex_1 )
+	#GAS_complex_1.automatedTest( 8 )
+	# or, to spend most of the time on the promising combinations only:
+	#GAS_complex_1.automatedTestRacing( 8 )
+	# and then, to see the summary and the impact analysis of the results:
+	#print( ResultsStore( "automatedTest_results.sqlite3" ).report() )
+	#GAS_complex_2 = GAS( parameters_complex_2 )
+	#GAS_complex_2.automatedTest()
+	
+	# in order to run several populations in parallel with migration between them (the island model), do something like:
+	#islands = Islands( parameters_testing, _islandCount = 4, _migrationInterval = 10, _migrationSize = 2, _migrationTopology = "ring" )
+	#islands.run( 300, do_print=True )
+	#islands.close()
+
+"""
+The above automated test ran for about 21 days or about 509.5 hours on a laptop. Runtime specs are:
+	- Python 3.6.2 (v3.6.2:5fd33b5, Jul  8 2017, 04:57:36) [MSC v.1900 64 bit (AMD64)] on win32
+	- Intel Core i7-4712MQ @ 2.3GHz , 4 core/8 logical processors Hyper Threading, utilising 2 cores and 12% total CPU
+	- Windows 7 Ultimate x64 bit, 8GB RAM
+	- 38,880 runs of 7,776 combinations (total number of combinations is 11,664 but some are skipped as per the code above)
+	
+	
+Some statistics and summary:
+
+						Best	Average		Worst
+Runtime					0.45 s	47.17 s		40,154.31 s
+Best Score for run		-67		-146		-559
+Average Score for run	-83.31	-323.14		-744.46
+Worst Score for run		-107	-805		-1,519
+
+- Optimal solution with score of -67 was reached 27 times, which is 0.0694 % success rate. Run times are (best/average/worst): 21.84 / 82.15 / 159.72
+- Excellent solutions with score >= -70 were reached 343 times, which is 0.8822 % success rate. Run times are: 7.35 / 74.42 / 278.23
+- Very good solutions with score >= -76 were reached 2082 times, whic is 5.3549 % success rate. Run times are: 3.53 / 83.61 / 10,676.38
+- Good solutins with score >= -86 were reached 7299 times, which is 18.7732 % success rate. Run times are: 1.40 / 80.88 / 10,676.38
+
+
+Impact Analysis
+
+	- Generations				50		150		300
+		Avg Time				16.56	43.54	81.42	high impact
+		Avg Best Score for run	-151	-144	-143	low impact
+	
+	- Cross Min Step			0.05	0.15	0.35
+		Avg Time				44.77	52.48	43.77	low impact
+		Avg Best Score for run	-146	-143	-151	low impact
+		
+	- Cross Max Step			0.10	0.30	0.50
+		Avg Time				45.75	51.32	44.89	low impact
+		Avg Best Score for run	-152	-145	-144	low impact
+		
+	- Population Size			50		200		600
+		Avg Time				12.03	38.92	90.58	high impact
+		Avg Best Score for run	-228	-116	-94		high impact
+		
+	- Survival Rate				0.05	0.15	0.50
+		Avg Time				23.07	35.67	82.79	high impact
+		Avg Best Score for run	-157	-135	-145	low impact
+		
+	- Mutation Probability		0.00	0.05	0.15	0.50
+		Avg Time				38.12	47.68	45.32	57.58	low impact
+		Avg Best Score for run	-156	-145	-140	-142	low impact
+	
+	- Mutation Size				0.05	0.15	0.25
+		Avg Time				41.30	45.76	54.47	low impact
+		Avg Best Score for run	-147	-146	-145	low impact
+	
+	- Infuse Random				0		5		15		30
+		Avg Time				40.10	49.33	46.86	52.40	low impact
+		Avg Best Score for run	-108	-116	-162	-197	high impact
+	
+	
+Best Overal Choices
+
+In order to achieve excellent solutions in under a minute the following can be considered:
+- Generations: It is an interesting mix of bell shaped curve and diminishing returns. The value should not be too high otherwise impacts run time.
+- Cross Min Step: Doesn't seem to have noticable impact, however it's probably best to choose a relatively low value.
+- Cross Max Step: Doesn't seem to have noticable impact either, however it's probably best to choose a middle-ish value between 0.35-0.50
+- Population Size: It clearly has high impact on both run time and score. A classical example of a trade off between speed and result. Choose a value of a few hundred. It seems that diversity is a very important factor in finding solutions.
+- Survival Rate: It has a high impact on run time, but not as much impact on score. It's best to choose a relatively low value, but not a minimal one.
+- Mutation Probability: Doesn't seem to have a huge impact on either run time or score. But it does have a small contribution, so it is best to choose a modest value.
+- Mutatation Size: Same as above.
+- Infuse Random: This actually turns out to be not a very good feature of any model. It adversely affects the score, so set to 0 and do not use it, or use with a very modest value.
+
+As a good model maybe use the following:
+	Generations: 120
+	"crossMinStep": 0.1
+	"crossMaxStep": 0.4
+	"populationSize": 500
+	"survivalRate": 0.15
+	"mutationProbability": 0.1
+	"mutationSize": 0.12
+	"infuseRandomToPopulation": 1
+"""
\ No newline at end of file